@@ -35,7 +35,9 @@ setup(
         'spaceone-api',
         'spaceone-tester',
         'schematics',
-        'google-api-python-client',
+        'google-api-python-client>=2.0.0',
+        'google-auth',
+        'requests',
         'MarkupSafe>=2.0.0rc2'
     ],
     package_data={
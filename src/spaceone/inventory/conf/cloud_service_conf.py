@@ -1,4 +1,6 @@
 MAX_WORKER = 20
+RESULT_QUEUE_SIZE = 1000
+RESULT_QUEUE_TIMEOUT = 1
 SUPPORTED_RESOURCE_TYPE = ['inventory.Server', 'inventory.CloudService', 'inventory.CloudServiceType', 'inventory.Region', 'inventory.ErrorResource' ]
 SUPPORTED_FEATURES = ['garbage_collection']
 SUPPORTED_SCHEDULES = ['hours']
@@ -14,3 +14,4 @@ from spaceone.inventory.connector.load_balancing import LoadBalancingConnector
 from spaceone.inventory.connector.big_query import BigQueryConnector
 from spaceone.inventory.connector.health_check import HealthCheckConnector
 from spaceone.inventory.connector.vm_instance import VMInstanceConnector
+from spaceone.inventory.connector.monitoring import MonitoringConnector
@@ -5,6 +5,10 @@ from spaceone.inventory.libs.connector import GoogleCloudConnector
 __all__ = ['BigQueryConnector']
 _LOGGER = logging.getLogger(__name__)
 
+QUERY_TIMEOUT_MS = 60000
+# __TABLES__ of datasets joined by UNION ALL in a single query
+MAX_UNION_DATASETS = 100
+
 
 class BigQueryConnector(GoogleCloudConnector):
     google_client_service = 'bigquery'
@@ -33,6 +37,15 @@ class BigQueryConnector(GoogleCloudConnector):
 
         return response
 
+    def batch_get_dataset(self, dataset_ids, **query):
+        '''
+        Return value is below
+        {'dataset_id': dataset | exception}
+        '''
+        requests = {dataset_id: self.client.datasets().get(projectId=self.project_id, datasetId=dataset_id, **query)
+                    for dataset_id in dataset_ids}
+        return self.execute_batch(requests)
+
     def list_job(self, **query):
         job_list = []
         query.update({'projectId': self.project_id,
@@ -47,6 +60,54 @@ class BigQueryConnector(GoogleCloudConnector):
 
         return job_list
 
+    def run_query(self, sql, location, **query):
+        '''
+        Run a standard SQL query with jobs.query and page through its results
+        Return value is below
+        [{'column_name': value}]
+        '''
+        query.update({'projectId': self.project_id,
+                      'body': {'query': sql, 'location': location, 'useLegacySql': False,
+                               'timeoutMs': QUERY_TIMEOUT_MS}})
+        response = self.client.jobs().query(**query).execute()
+        job_id = response.get('jobReference', {}).get('jobId')
+
+        rows = []
+        while True:
+            if response.get('jobComplete', False):
+                field_names = [field.get('name') for field in response.get('schema', {}).get('fields', [])]
+                for row in response.get('rows', []):
+                    rows.append({name: column.get('v') for name, column in zip(field_names, row.get('f', []))})
+                if 'pageToken' not in response:
+                    return rows
+
+            results_query = {'projectId': self.project_id, 'jobId': job_id, 'location': location,
+                             'timeoutMs': QUERY_TIMEOUT_MS}
+            if response.get('jobComplete', False):
+                results_query.update({'pageToken': response['pageToken']})
+            response = self.client.jobs().getQueryResults(**results_query).execute()
+
+    def query_information_schema(self, view, location, columns):
+        sql = f'SELECT {", ".join(columns)} ' \
+              f'FROM `{self.project_id}`.`region-{location.lower()}`.INFORMATION_SCHEMA.{view}'
+        return self.run_query(sql, location)
+
+    def list_tables_last_modified_times(self, dataset_ids, location):
+        '''
+        __TABLES__ of every dataset in the location, MAX_UNION_DATASETS datasets per query
+        Return value is below
+        {('dataset_id', 'table_id'): last_modified_time}
+        '''
+        last_modified_times = {}
+        for offset in range(0, len(dataset_ids), MAX_UNION_DATASETS):
+            sql = ' UNION ALL '.join(f'SELECT dataset_id, table_id, last_modified_time '
+                                     f'FROM `{self.project_id}`.`{dataset_id}`.__TABLES__'
+                                     for dataset_id in dataset_ids[offset:offset + MAX_UNION_DATASETS])
+            for row in self.run_query(sql, location):
+                last_modified_times[(row.get('dataset_id'), row.get('table_id'))] = row.get('last_modified_time')
+
+        return last_modified_times
+
     def list_projects(self, **query):
         project_list = []
         request = self.client.projects().list(**query)
@@ -82,3 +143,13 @@ class BigQueryConnector(GoogleCloudConnector):
         response = self.client.tables().get(**query).execute()
 
         return response
+
+    def batch_get_tables(self, dataset_id, table_ids, **query):
+        '''
+        Return value is below
+        {'table_id': table | exception}
+        '''
+        requests = {table_id: self.client.tables().get(projectId=self.project_id, datasetId=dataset_id,
+                                                        tableId=table_id, **query)
+                    for table_id in table_ids}
+        return self.execute_batch(requests)
@@ -49,6 +49,30 @@ class CloudSQLConnector(GoogleCloudConnector):
 
         return user_list
 
+    def batch_list_databases(self, instance_names, **query):
+        '''
+        Return value is below
+        {'instance_name': [database] | exception}
+        '''
+        requests = {instance_name: self.client.databases().list(project=self.project_id, instance=instance_name,
+                                                                **query)
+                    for instance_name in instance_names}
+        return self._get_batch_items(self.execute_batch(requests))
+
+    def batch_list_users(self, instance_names, **query):
+        '''
+        Return value is below
+        {'instance_name': [user] | exception}
+        '''
+        requests = {instance_name: self.client.users().list(project=self.project_id, instance=instance_name, **query)
+                    for instance_name in instance_names}
+        return self._get_batch_items(self.execute_batch(requests))
+
+    @staticmethod
+    def _get_batch_items(batch_responses):
+        return {key: response if isinstance(response, Exception) else response.get('items', [])
+                for key, response in batch_responses.items()}
+
     def list_backup_runs(self, instance_name, **query):
         backup_runs_list = []
         query.update({'project': self.project_id, 'instance': instance_name})
@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['DiskConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,19 +13,12 @@ class DiskConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('disks.aggregatedList')
     def list_disks(self, **query):
-        disk_list = []
-        query.update({'project': self.project_id})
-        request = self.client.disks().aggregatedList(**query)
+        return list(self.iter_disks(**query))
 
-        while request is not None:
-            response = request.execute()
-            for key, _disk in response['items'].items():
-                if 'disks' in _disk:
-                    disk_list.extend(_disk.get('disks'))
-            request = self.client.disks().aggregatedList_next(previous_request=request,
-                                                                  previous_response=response)
-        return disk_list
+    def iter_disks(self, **query):
+        return self.iter_aggregated_list(self.client.disks(), 'disks', **query)
 
     def list_resource_policies(self, **query):
         resource_policy_vo = {}
@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['ExternalIPAddressConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class ExternalIPAddressConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('instances.aggregatedList')
     def list_instance_for_networks(self, **query):
         instance_list = []
         query.update({'project': self.project_id, 'includeAllScopes': False, 'maxResults': 500})
@@ -27,6 +28,7 @@ class ExternalIPAddressConnector(GoogleCloudConnector):
 
         return instance_list
 
+    @cached_list('forwardingRules.aggregatedList')
     def list_forwarding_rule(self, **query):
         forwarding_rule_list = []
         query.update({'project': self.project_id, 'includeAllScopes': False, 'maxResults': 500})
@@ -42,6 +44,7 @@ class ExternalIPAddressConnector(GoogleCloudConnector):
 
         return forwarding_rule_list
 
+    @cached_list('addresses.aggregatedList')
     def list_regional_addresses(self, **query):
         address_list = []
         query = self.generate_query(**query)
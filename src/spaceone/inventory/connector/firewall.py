@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['FirewallConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class FirewallConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('firewalls.list')
     def list_firewall(self, **query):
         firewalls_list = []
         query.update({'project': self.project_id})
@@ -26,6 +27,7 @@ class FirewallConnector(GoogleCloudConnector):
 
         return firewalls_list
 
+    @cached_list('instances.aggregatedList')
     def list_instance_for_networks(self, **query):
         instance_list = []
         query.update({'project': self.project_id,
@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['HealthCheckConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class HealthCheckConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('healthChecks.aggregatedList')
     def list_health_checks(self, **query):
         health_checks_list = []
         query.update({'project': self.project_id})
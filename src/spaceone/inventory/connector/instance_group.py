@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['InstanceGroupConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,18 +13,7 @@ class InstanceGroupConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def list_instances(self, instance_group, loc, loc_type, **query):
-        query.update({'project': self.project_id,
-                      'instanceGroup': instance_group,
-                      loc_type: loc
-                      })
-
-        request = self.client.instanceGroups().listInstances(**query) if loc_type == 'zone' \
-            else self.client.regionInstanceGroups().listInstances(**query)
-        response = request.execute()
-
-        return response.get('items', [])
-
+    @cached_list('instanceTemplates.list')
     def list_instance_templates(self, **query):
         instance_template_list = []
         query.update({'project': self.project_id})
@@ -38,6 +27,7 @@ class InstanceGroupConnector(GoogleCloudConnector):
 
         return instance_template_list
 
+    @cached_list('instanceGroups.aggregatedList')
     def list_instance_groups(self, **query):
         instance_group_list = []
         query.update({'project': self.project_id})
@@ -52,6 +42,7 @@ class InstanceGroupConnector(GoogleCloudConnector):
 
         return instance_group_list
 
+    @cached_list('instanceGroupManagers.aggregatedList')
     def list_instance_group_managers(self, **query):
         instance_group_manager_list = []
         query.update({'project': self.project_id})
@@ -66,6 +57,7 @@ class InstanceGroupConnector(GoogleCloudConnector):
 
         return instance_group_manager_list
 
+    @cached_list('autoscalers.aggregatedList')
     def list_autoscalers(self, **query):
         autoscaler_list = []
         query.update({'project': self.project_id})
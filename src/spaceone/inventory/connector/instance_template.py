@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['InstanceTemplateConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +30,7 @@ class InstanceTemplateConnector(GoogleCloudConnector):
         return disk_list
     '''
 
+    @cached_list('instanceTemplates.list')
     def list_instance_templates(self, **query):
         instance_template_list = []
         query.update({'project': self.project_id})
@@ -43,6 +44,7 @@ class InstanceTemplateConnector(GoogleCloudConnector):
 
         return instance_template_list
 
+    @cached_list('instanceGroupManagers.aggregatedList')
     def list_instance_group_managers(self, **query):
         instance_group_manager_list = []
         query.update({'project': self.project_id})
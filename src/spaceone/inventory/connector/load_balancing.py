@@ -1,5 +1,5 @@
 import logging
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['LoadBalancingConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -12,6 +12,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('urlMaps.aggregatedList')
     def list_url_maps(self, **query):
         url_map_list = []
         query.update({'project': self.project_id})
@@ -26,6 +27,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return url_map_list
 
+    @cached_list('backendServices.aggregatedList')
     def list_backend_services(self, **query):
         backend_svc_list = []
         query.update({'project': self.project_id})
@@ -40,6 +42,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return backend_svc_list
 
+    @cached_list('targetPools.aggregatedList')
     def list_target_pools(self, **query):
         target_pool_list = []
         query.update({'project': self.project_id})
@@ -54,19 +57,12 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return target_pool_list
 
+    @cached_list('forwardingRules.aggregatedList')
     def list_forwarding_rules(self, **query):
-        forwarding_rule_list = []
-        query.update({'project': self.project_id})
-        request = self.client.forwardingRules().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, forwarding_scoped_list in response['items'].items():
-                if 'forwardingRules' in forwarding_scoped_list:
-                    forwarding_rule_list.extend(forwarding_scoped_list.get('forwardingRules'))
-            request = self.client.forwardingRules().aggregatedList_next(previous_request=request,
-                                                                        previous_response=response)
+        return list(self.iter_forwarding_rules(**query))
 
-        return forwarding_rule_list
+    def iter_forwarding_rules(self, **query):
+        return self.iter_aggregated_list(self.client.forwardingRules(), 'forwardingRules', **query)
 
     def list_tcp_proxies(self, **query):
         tcp_proxy_list = []
@@ -158,6 +154,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return ssl_certificate_list
 
+    @cached_list('healthChecks.aggregatedList')
     def list_health_checks(self, **query):
         health_check_list = []
         query.update({'project': self.project_id})
@@ -198,6 +195,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return https_health_list
 
+    @cached_list('instanceGroupManagers.aggregatedList')
     def list_instance_groups(self, **query):
         instance_group_list = []
         query.update({'project': self.project_id})
@@ -212,6 +210,7 @@ class LoadBalancingConnector(GoogleCloudConnector):
 
         return instance_group_list
 
+    @cached_list('autoscalers.aggregatedList')
     def list_autoscalers(self, **query):
         autoscaler_list = []
         query.update({'project': self.project_id})
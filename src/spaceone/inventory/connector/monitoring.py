@@ -0,0 +1,67 @@
+import logging
+from datetime import datetime, timedelta
+
+from spaceone.inventory.libs.connector import GoogleCloudConnector
+
+__all__ = ['MonitoringConnector']
+_LOGGER = logging.getLogger(__name__)
+
+# Storage metrics are sampled once a day
+STORAGE_METRIC_PERIOD = 86400
+
+
+class MonitoringConnector(GoogleCloudConnector):
+    google_client_service = 'monitoring'
+    version = 'v3'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def list_time_series(self, **query):
+        time_series_list = []
+        query.update({'name': f'projects/{self.project_id}'})
+        request = self.client.projects().timeSeries().list(**query)
+        while request is not None:
+            response = request.execute()
+            for time_series in response.get('timeSeries', []):
+                time_series_list.append(time_series)
+            request = self.client.projects().timeSeries().list_next(previous_request=request,
+                                                                    previous_response=response)
+
+        return time_series_list
+
+    def list_bucket_metric(self, metric_type):
+        '''
+        Latest value of a storage metric per bucket, storage classes of a bucket are summed
+        Return value is below
+        {'bucket_name': value}
+        '''
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(seconds=STORAGE_METRIC_PERIOD * 2)
+        time_series_list = self.list_time_series(**{
+            'filter': f'metric.type="storage.googleapis.com/{metric_type}"',
+            'interval_startTime': start_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'interval_endTime': end_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'aggregation_alignmentPeriod': f'{STORAGE_METRIC_PERIOD}s',
+            'aggregation_perSeriesAligner': 'ALIGN_MAX',
+            'aggregation_crossSeriesReducer': 'REDUCE_SUM',
+            'aggregation_groupByFields': 'resource.label.bucket_name',
+            'view': 'FULL'
+        })
+
+        bucket_metric = {}
+        for time_series in time_series_list:
+            bucket_name = time_series.get('resource', {}).get('labels', {}).get('bucket_name')
+            points = time_series.get('points', [])
+            if bucket_name and points:
+                # Points are returned in reverse time order
+                bucket_metric[bucket_name] = self._get_point_value(points[0])
+
+        return bucket_metric
+
+    @staticmethod
+    def _get_point_value(point):
+        value = point.get('value', {})
+        if 'int64Value' in value:
+            return int(value['int64Value'])
+        return float(value.get('doubleValue', 0))
@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['RouteConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class RouteConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('routes.list')
     def list_routes(self, **query):
         route_list = []
         query.update({'project': self.project_id})
@@ -26,6 +27,7 @@ class RouteConnector(GoogleCloudConnector):
 
         return route_list
 
+    @cached_list('instances.aggregatedList')
     def list_instance(self, **query):
         instance_list = []
         query.update({'project': self.project_id,
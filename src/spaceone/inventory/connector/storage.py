@@ -1,11 +1,42 @@
+import time
 import logging
+import threading
+import concurrent.futures
 
 from spaceone.inventory.libs.connector import GoogleCloudConnector
 
-__all__ = ['StorageConnector']
+__all__ = ['StorageConnector', 'ObjectListBudget', 'MAX_OBJECTS', 'LIST_TIME_BUDGET', 'LIST_MAX_API_CALLS']
 _LOGGER = logging.getLogger(__name__)
 
 MAX_OBJECTS = 100000
+OBJECT_PAGE_SIZE = 1000
+PROGRESS_LOG_OBJECTS = 100000
+NUMBER_OF_SHARDS = 8
+# Prefix listers of every bucket in the process, bounds bucket concurrency x shards
+MAX_SHARD_WORKERS = 16
+LIST_TIME_BUDGET = 300
+LIST_MAX_API_CALLS = 1000
+
+
+class ObjectListBudget(object):
+    """ Time and API call budget shared by every shard listing a bucket
+    """
+
+    def __init__(self, time_budget=LIST_TIME_BUDGET, max_api_calls=LIST_MAX_API_CALLS):
+        self._lock = threading.Lock()
+        self.deadline = time.time() + time_budget
+        self.max_api_calls = max_api_calls
+        self.api_calls = 0
+
+    def spend(self):
+        with self._lock:
+            if self.api_calls >= self.max_api_calls or time.time() >= self.deadline:
+                return False
+            self.api_calls += 1
+            return True
+
+
+_shard_executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_SHARD_WORKERS)
 
 
 class StorageConnector(GoogleCloudConnector):
@@ -33,20 +64,117 @@ class StorageConnector(GoogleCloudConnector):
 
         return result
 
-    def list_objects(self, bucket_name, **query):
-        objects_list = []
-        query.update({"bucket": bucket_name})
-        count = 0
-        request = self.client.objects().list(**query)
+    def batch_list_iam_policy(self, bucket_names, **query):
+        '''
+        Return value is below
+        {'bucket_name': iam_policy | exception}
+        '''
+        requests = {bucket_name: self.client.buckets().getIamPolicy(bucket=bucket_name, **query)
+                    for bucket_name in bucket_names}
+        return self.execute_batch(requests)
+
+    def get_object_stats(self, bucket_name, max_objects=MAX_OBJECTS, **query):
+        '''
+        Count objects and sum their sizes page by page, only the size of each object is requested.
+        If the bucket has more than max_objects, the totals counted so far are returned as partial.
+
+        Return value is (object_count, object_total_size, is_complete)
+        '''
+        query.update({'bucket': bucket_name, 'fields': 'items(size),nextPageToken'})
+        object_count, object_total_size, _, is_complete = self._list_object_stats(max_objects=max_objects, **query)
+        if not is_complete:
+            _LOGGER.debug(f'[get_object_stats] {bucket_name} has more than {max_objects} objects, partial totals')
+
+        return object_count, object_total_size, is_complete
+
+    def get_object_stats_by_prefix(self, bucket_name, budget=None, shards=NUMBER_OF_SHARDS, **query):
+        '''
+        Discover top-level prefixes with delimiter='/' and sum the objects of each prefix concurrently.
+        Prefixes of every bucket share the shard pool, at most `shards` prefixes of a bucket are listed at the same time.
+        Listing stops once the budget of the bucket is spent, then the totals so far are returned as partial.
+
+        Return value is (object_count, object_total_size, is_complete)
+        '''
+        budget = budget or ObjectListBudget()
+
+        # Objects at the top level are counted while discovering prefixes
+        query.update({'bucket': bucket_name, 'delimiter': '/', 'fields': 'items(size),prefixes,nextPageToken'})
+        object_count, object_total_size, prefixes, is_complete = self._list_object_stats(budget=budget, **query)
+        if not is_complete:
+            return object_count, object_total_size, False
+
+        # A single prefix gains nothing from the shard pool
+        if len(prefixes) < 2:
+            prefix_stats = [self._get_prefix_object_stats(bucket_name, prefix, budget) for prefix in prefixes]
+        else:
+            prefix_stats = self._iter_prefix_object_stats(bucket_name, prefixes, budget, shards)
+
+        for prefix_count, prefix_size, prefix_complete in prefix_stats:
+            object_count += prefix_count
+            object_total_size += prefix_size
+            is_complete = is_complete and prefix_complete
+
+        _LOGGER.debug(f'[get_object_stats_by_prefix] {bucket_name} => {len(prefixes)} prefixes, '
+                      f'{budget.api_calls} api calls, {object_count} objects, {object_total_size} bytes')
+        return object_count, object_total_size, is_complete
+
+    def _iter_prefix_object_stats(self, bucket_name, prefixes, budget, shards):
+        # At most `shards` prefixes of the bucket are in flight, the rest are cancelled if listing fails
+        prefixes = iter(prefixes)
+        future_prefixes = set()
+        try:
+            while True:
+                for prefix in prefixes:
+                    future_prefixes.add(_shard_executor.submit(self._get_prefix_object_stats, bucket_name, prefix,
+                                                               budget))
+                    if len(future_prefixes) >= shards:
+                        break
+
+                if not future_prefixes:
+                    return
+
+                done, future_prefixes = concurrent.futures.wait(future_prefixes,
+                                                                return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in future_prefixes:
+                future.cancel()
+
+    def _get_prefix_object_stats(self, bucket_name, prefix, budget):
+        object_count, object_total_size, _, is_complete = \
+            self._list_object_stats(budget=budget, bucket=bucket_name, prefix=prefix,
+                                    fields='items(size),nextPageToken')
+        return object_count, object_total_size, is_complete
+
+    def _list_object_stats(self, budget=None, max_objects=None, **query):
+        '''
+        Count objects and sum their sizes over the pages of objects.list(**query).
+        Listing stops when the budget is spent or max_objects are counted.
+
+        Return value is (object_count, object_total_size, prefixes, is_complete)
+        '''
+        object_count = 0
+        object_total_size = 0
+        prefixes = []
+        request = self.client.objects().list(maxResults=OBJECT_PAGE_SIZE, **query)
         while request is not None:
+            if budget is not None and not budget.spend():
+                return object_count, object_total_size, prefixes, False
+
             response = request.execute()
-            result = response.get('items', [])
-            count = count + len(result)
-            for template in result:
-                objects_list.append({'size': template['size']})
-            # Max iteration
-            if count > MAX_OBJECTS:
-                # TOO MANY objects
-                return False
+            items = response.get('items', [])
+            object_count += len(items)
+            object_total_size += sum(int(item.get('size', 0)) for item in items)
+            prefixes.extend(response.get('prefixes', []))
+
+            if object_count // PROGRESS_LOG_OBJECTS > (object_count - len(items)) // PROGRESS_LOG_OBJECTS:
+                _LOGGER.debug(f'[_list_object_stats] {query.get("bucket")}/{query.get("prefix", "")} => '
+                              f'{object_count} objects, {object_total_size} bytes')
+
+            if max_objects is not None and object_count >= max_objects and 'nextPageToken' in response:
+                return object_count, object_total_size, prefixes, False
+
             request = self.client.objects().list_next(previous_request=request, previous_response=response)
-        return objects_list
+
+        return object_count, object_total_size, prefixes, True
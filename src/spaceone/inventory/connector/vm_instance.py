@@ -1,14 +1,18 @@
 import logging
 import os
-import google.oauth2.service_account
-import googleapiclient
-import googleapiclient.discovery
+import concurrent.futures
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list, cached_catalog, iter_pages
+from spaceone.inventory.libs.client_cache import client_cache
 
-__all__ = ["VMInstanceConnector"]
+__all__ = ["VMInstanceConnector", "NUMBER_OF_ZONE_SHARDS"]
 _LOGGER = logging.getLogger(__name__)
 INSTANCE_TYPE_FILE = '%s/conf/%s' % (os.path.dirname(os.path.abspath(__file__)), 'instances.json')
+# Zones listed at the same time by iter_instances_by_zone
+NUMBER_OF_ZONE_SHARDS = 16
+# Statuses of the collected VMs, DEPROVISIONING, PENDING_STOP and STOPPED are not collected
+INSTANCE_STATUSES = ['PROVISIONING', 'STAGING', 'RUNNING', 'STOPPING', 'REPAIRING', 'SUSPENDING', 'SUSPENDED',
+                     'TERMINATED']
 
 
 class VMInstanceConnector(GoogleCloudConnector):
@@ -31,54 +35,73 @@ class VMInstanceConnector(GoogleCloudConnector):
             - ...
         """
         self.project_id = secret_data.get('project_id')
-        credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
-        self.client = googleapiclient.discovery.build('compute', 'v1', credentials=credentials)
+        self.credentials = client_cache.get_credentials(secret_data)
+        self.client = client_cache.get_client(secret_data, 'compute', 'v1')
 
+    @cached_catalog('regions')
     def list_regions(self):
         result = self.client.regions().list(project=self.project_id).execute()
         return result.get('items', [])
 
+    @cached_catalog('zones')
     def list_zones(self):
         result = self.client.zones().list(project=self.project_id).execute()
         return result.get('items', [])
 
-    def list_instances(self, **query):
-        status_filter = {'key': 'status', 'values': ['PROVISIONING', 'STAGING', 'RUNNING', 'STOPPING', 'REPAIRING',
-                                                     'SUSPENDING', 'SUSPENDED', 'TERMINATED']}
-        if 'filter' in query:
-            query.get('filter').append(status_filter)
-        else:
-            query.update({'filter': [status_filter]})
+    # Same request as list_instance_for_networks / list_instance of the network connectors, so the result is shared
+    @cached_list('instances.aggregatedList')
+    def list_all_instances(self):
+        return list(self.iter_aggregated_list(self.client.instances(), 'instances',
+                                              includeAllScopes=False, maxResults=500))
+
+    def list_instances(self):
+        # Instances of iter_instances(), filtered by status from the shared unfiltered list
+        return [instance for instance in self.list_all_instances() if instance.get('status') in INSTANCE_STATUSES]
 
-        query = self.generate_key_query('filter', self._get_filter_to_params(**query), '', is_default=True, **query)
+    def iter_instances(self, **query):
+        query = self._get_instance_query(**query)
+        return self.iter_aggregated_list(self.client.instances(), 'instances', **query)
 
+    def iter_instances_by_zone(self, zones, max_workers=NUMBER_OF_ZONE_SHARDS, **query):
+        """ Yield instances of every zone from instances.list, at most max_workers zones are listed at the same time
+
+        Items have the same shape as iter_instances(), they are yielded in the order the zones finish.
+        """
+        query = self._get_instance_query(**query)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_zones = [executor.submit(self._list_zone_instances, zone, **query) for zone in zones]
+            try:
+                for future in concurrent.futures.as_completed(future_zones):
+                    yield from future.result()
+            finally:
+                for future in future_zones:
+                    future.cancel()
+
+    def _list_zone_instances(self, zone, **query):
         instance_list = []
-        query.update({'project': self.project_id})
-        request = self.client.instances().aggregatedList(**query)
+        resource = self.client.instances()
+        for response in iter_pages(resource.list(zone=zone, **query), resource.list_next):
+            instance_list.extend(response.get('items', []))
 
-        while request is not None:
-            response = request.execute()
-            for key, _instance_list in response['items'].items():
-                if 'instances' in _instance_list:
-                    instance_list.extend(_instance_list.get('instances'))
-            request = self.client.instances().aggregatedList_next(previous_request=request,
-                                                                  previous_response=response)
         return instance_list
 
+    def _get_instance_query(self, **query):
+        status_filter = {'key': 'status', 'values': INSTANCE_STATUSES}
+        if 'filter' in query:
+            query.get('filter').append(status_filter)
+        else:
+            query.update({'filter': [status_filter]})
+
+        return self.generate_key_query('filter', self._get_filter_to_params(**query), '', is_default=True, **query)
+
+    @cached_catalog('machine_types')
     def list_machine_types(self, **query):
-        machine_type_list = []
-        query.update({'project': self.project_id})
-        request = self.client.machineTypes().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, machine_type in response['items'].items():
-                if 'machineTypes' in machine_type:
-                    machine_type_list.extend(machine_type.get('machineTypes'))
-            request = self.client.machineTypes().aggregatedList_next(previous_request=request,
-                                                                     previous_response=response)
+        return list(self.iter_machine_types(**query))
 
-        return machine_type_list
+    def iter_machine_types(self, **query):
+        return self.iter_aggregated_list(self.client.machineTypes(), 'machineTypes', **query)
 
+    @cached_list('urlMaps.aggregatedList')
     def list_url_maps(self, **query):
         url_map_list = []
         query.update({'project': self.project_id})
@@ -93,6 +116,7 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return url_map_list
 
+    @cached_list('backendServices.aggregatedList')
     def list_back_end_services(self, **query):
         backend_svc_list = []
         query.update({'project': self.project_id})
@@ -107,20 +131,14 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return backend_svc_list
 
+    @cached_list('disks.aggregatedList')
     def list_disks(self, **query):
-        disk_list = []
-        query.update({'project': self.project_id})
-        request = self.client.disks().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _disk in response['items'].items():
-                if 'disks' in _disk:
-                    disk_list.extend(_disk.get('disks'))
-            request = self.client.disks().aggregatedList_next(previous_request=request,
-                                                              previous_response=response)
+        return list(self.iter_disks(**query))
 
-        return disk_list
+    def iter_disks(self, **query):
+        return self.iter_aggregated_list(self.client.disks(), 'disks', **query)
 
+    @cached_list('autoscalers.aggregatedList')
     def list_autoscalers(self, **query):
         autoscaler_list = []
         query.update({'project': self.project_id})
@@ -135,6 +153,7 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return autoscaler_list
 
+    @cached_list('firewalls.list')
     def list_firewall(self, **query):
         firewalls_list = []
         query.update({'project': self.project_id})
@@ -164,14 +183,18 @@ class VMInstanceConnector(GoogleCloudConnector):
         ]
 
         for public_image in public_image_list:
-            query.update({'project': public_image.get('value'),
-                          'orderBy': 'creationTimestamp desc'}
-                         )
-            response = self.client.images().list(**query).execute()
-            public_images[public_image.get('key')] = response.get('items', [])
+            public_images[public_image.get('key')] = self.list_project_images(public_image.get('value'), **query)
 
         return public_images
 
+    # Images of an image project are the same for every tenant
+    @cached_catalog('public_images', shared=True)
+    def list_project_images(self, image_project, **query):
+        query.update({'project': image_project, 'orderBy': 'creationTimestamp desc'})
+        response = self.client.images().list(**query).execute()
+        return response.get('items', [])
+
+    @cached_list('instanceGroups.aggregatedList')
     def list_instance_groups(self, **query):
         instance_group_list = []
         query.update({'project': self.project_id})
@@ -196,18 +219,8 @@ class VMInstanceConnector(GoogleCloudConnector):
     '''
     Query all instance list from managed instance group
     '''
-    def list_instance_from_instance_groups(self, instance_group_name, key, loc, **query):
-        query = self.generate_query(**query)
-        query.update({key: loc, 'instanceGroup': instance_group_name})
-        response = []
-
-        request = self.client.instanceGroups().listInstances(**query).execute() if key == 'zone' else \
-            self.client.regionInstanceGroups().listInstances(**query).execute()
-        response = request.get('items', [])
-
-        return response
-
     # Queries managed instance groups
+    @cached_list('instanceGroupManagers.aggregatedList')
     def list_instance_group_managers(self, **query):
         instance_group_manager_list = []
         query.update({'project': self.project_id})
@@ -222,6 +235,7 @@ class VMInstanceConnector(GoogleCloudConnector):
                                                                               previous_response=response)
         return instance_group_manager_list
 
+    @cached_list('networks.list')
     def list_vpcs(self, **query):
         network_list = []
         query.update({'project': self.project_id})
@@ -234,6 +248,7 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return network_list
 
+    @cached_list('subnetworks.aggregatedList')
     def list_subnetworks(self, **query):
         subnetworks_list = []
         query = self.generate_query(**query)
@@ -248,6 +263,7 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return subnetworks_list
 
+    @cached_list('targetPools.aggregatedList')
     def list_target_pools(self, **query):
         target_pool_list = []
         query.update({'project': self.project_id})
@@ -263,18 +279,12 @@ class VMInstanceConnector(GoogleCloudConnector):
 
         return target_pool_list
 
+    @cached_list('forwardingRules.aggregatedList')
     def list_forwarding_rules(self, **query):
-        forwarding_rule_list = []
-        query.update({'project': self.project_id})
-        request = self.client.forwardingRules().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, forwarding_scoped_list in response['items'].items():
-                if 'forwardingRules' in forwarding_scoped_list:
-                    forwarding_rule_list.extend(forwarding_scoped_list.get('forwardingRules'))
-            request = self.client.forwardingRules().aggregatedList_next(previous_request=request,
-                                                                        previous_response=response)
-        return forwarding_rule_list
+        return list(self.iter_forwarding_rules(**query))
+
+    def iter_forwarding_rules(self, **query):
+        return self.iter_aggregated_list(self.client.forwardingRules(), 'forwardingRules', **query)
 
     def get_instance_in_group(self, key, value, instance_group, **query):
         query.update({'project': self.project_id, key: value, 'instanceGroup': instance_group})
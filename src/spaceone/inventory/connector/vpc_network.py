@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.inventory.libs.connector import GoogleCloudConnector
+from spaceone.inventory.libs.connector import GoogleCloudConnector, cached_list
 
 __all__ = ['VPCNetworkConnector']
 _LOGGER = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_list('instances.aggregatedList')
     def list_instance_for_networks(self, **query):
         instance_list = []
         query.update({'project': self.project_id,
@@ -29,6 +30,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return instance_list
 
+    @cached_list('forwardingRules.aggregatedList')
     def list_forwarding_rule(self, **query):
         forwarding_rule_list = []
         query.update({'project': self.project_id,
@@ -46,6 +48,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return forwarding_rule_list
 
+    @cached_list('networks.list')
     def list_networks(self, **query):
         network_list = []
         query.update({'project': self.project_id})
@@ -58,6 +61,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return network_list
 
+    @cached_list('addresses.aggregatedList')
     def list_regional_addresses(self, **query):
         address_list = []
         query = self.generate_query(**query)
@@ -72,6 +76,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return address_list
 
+    @cached_list('subnetworks.aggregatedList')
     def list_subnetworks(self, **query):
         subnetworks_list = []
         query = self.generate_query(**query)
@@ -86,6 +91,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return subnetworks_list
 
+    @cached_list('routes.list')
     def list_routes(self, **query):
         route_list = []
         query.update({'project': self.project_id })
@@ -99,6 +105,7 @@ class VPCNetworkConnector(GoogleCloudConnector):
 
         return route_list
 
+    @cached_list('firewalls.list')
     def list_firewall(self, **query):
         firewall_list = []
         query.update({'project': self.project_id})
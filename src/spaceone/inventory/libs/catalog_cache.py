@@ -0,0 +1,96 @@
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_CACHE_PATH = '/tmp/spaceone/google_cloud/catalog_cache.db'
+DEFAULT_CATALOG_TTL = 3600
+# Seconds until a catalog of each kind is refreshed
+CATALOG_TTLS = {
+    'machine_types': 86400,
+    'public_images': 21600,
+    'regions': 86400,
+    'zones': 86400
+}
+
+_catalog_caches = {}
+_catalog_caches_lock = threading.Lock()
+
+
+class CatalogCache(object):
+    """ Near-static catalog lists kept on disk across collects
+
+    key: (kind, key)
+    Entries within the ttl of their kind are returned as they are.
+    Stale entries are returned too, and a single background fetch refreshes them for the next access.
+    Missing entries are fetched by the caller.
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG_CACHE_PATH, ttls=None):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS catalog_cache ('
+                           'kind TEXT, key TEXT, data TEXT, fetched_at REAL, PRIMARY KEY (kind, key))')
+        self._conn.commit()
+        self._refreshing = set()
+        self.ttls = {**CATALOG_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, kind, key, fetch):
+        with self._lock:
+            row = self._conn.execute('SELECT data, fetched_at FROM catalog_cache WHERE kind = ? AND key = ?',
+                                     (kind, key)).fetchone()
+            if row is None:
+                self.misses += 1
+            elif time.time() - row[1] < self.ttls.get(kind, DEFAULT_CATALOG_TTL):
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self._revalidate(kind, key, fetch)
+
+        if row is None:
+            data = fetch()
+            self._put(kind, key, data)
+            return data
+
+        return json.loads(row[0])
+
+    def _revalidate(self, kind, key, fetch):
+        # Called with the lock held, only one refresh runs for each entry
+        if (kind, key) in self._refreshing:
+            return
+
+        self._refreshing.add((kind, key))
+        threading.Thread(target=self._refresh, args=(kind, key, fetch), daemon=True).start()
+
+    def _refresh(self, kind, key, fetch):
+        try:
+            self._put(kind, key, fetch())
+            _LOGGER.debug(f'[CatalogCache] refreshed {kind}')
+        except Exception as e:
+            # The stale entry is kept and the next access tries again
+            _LOGGER.error(f'[CatalogCache] failed to refresh {kind} => {e}', exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing.discard((kind, key))
+
+    def _put(self, kind, key, data):
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO catalog_cache VALUES (?, ?, ?, ?)',
+                               (kind, key, json.dumps(data), time.time()))
+            self._conn.commit()
+
+
+def get_catalog_cache(path=DEFAULT_CATALOG_CACHE_PATH):
+    """ CatalogCache of the path, shared by every manager and tenant in the process """
+    with _catalog_caches_lock:
+        if path not in _catalog_caches:
+            _catalog_caches[path] = CatalogCache(path)
+        return _catalog_caches[path]
@@ -0,0 +1,75 @@
+import time
+import logging
+import threading
+
+import google.oauth2.service_account
+import google.auth.transport.requests
+
+from spaceone.inventory.libs.discovery import build_client
+from spaceone.inventory.libs.transport import ThreadLocalHttp, CLOUD_PLATFORM_SCOPE
+
+_LOGGER = logging.getLogger(__name__)
+
+CLIENT_TTL = 3600
+
+
+class ClientCache(object):
+    """ Credentials and discovery clients shared by every connector in the process
+
+    credentials key: (client_email, private_key_id)
+    client key: (client_email, private_key_id, api, version)
+    Entries older than ttl are evicted and built again on the next access.
+    """
+
+    def __init__(self, ttl=CLIENT_TTL):
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._credentials = {}
+        self._clients = {}
+        self.ttl = ttl
+
+    def get_credentials(self, secret_data):
+        key = (secret_data.get('client_email'), secret_data.get('private_key_id'))
+        return self._get(self._credentials, key, lambda: self._build_credentials(secret_data))
+
+    def get_client(self, secret_data, api, version):
+        credentials = self.get_credentials(secret_data)
+        key = (secret_data.get('client_email'), secret_data.get('private_key_id'), api, version)
+        return self._get(self._clients, key, lambda: self._build_client(credentials, api, version))
+
+    def refresh_credentials(self, credentials):
+        if credentials.valid:
+            return
+
+        with self._refresh_lock:
+            if not credentials.valid:
+                credentials.refresh(google.auth.transport.requests.Request())
+
+    def _get(self, entries, key, build):
+        with self._lock:
+            self._evict_expired(entries)
+            if key in entries:
+                return entries[key][0]
+
+        value = build()
+        with self._lock:
+            # Concurrent builds of the same key keep the first one
+            return entries.setdefault(key, (value, time.time() + self.ttl))[0]
+
+    @staticmethod
+    def _evict_expired(entries):
+        now = time.time()
+        for key in [key for key, (_, expires_at) in entries.items() if expires_at <= now]:
+            del entries[key]
+
+    @staticmethod
+    def _build_credentials(secret_data):
+        credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
+        return credentials.with_scopes([CLOUD_PLATFORM_SCOPE])
+
+    def _build_client(self, credentials, api, version):
+        _LOGGER.debug(f'[ClientCache] build client => {api}.{version}')
+        return build_client(api, version, ThreadLocalHttp(credentials, self.refresh_credentials))
+
+
+client_cache = ClientCache()
@@ -0,0 +1,45 @@
+import copy
+import logging
+import threading
+import concurrent.futures
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CollectCache(object):
+    """ Raw API list results shared by every manager in a single collect
+
+    key: (project_id, api method, query)
+    The first caller of a key fetches it, concurrent callers of the same key wait for that result.
+    Failed fetches are not cached, so the next caller retries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, fetch):
+        with self._lock:
+            result = self._results.get(key)
+            is_owner = result is None
+            if is_owner:
+                result = concurrent.futures.Future()
+                self._results[key] = result
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if is_owner:
+            try:
+                result.set_result(fetch())
+            except Exception as e:
+                with self._lock:
+                    self._results.pop(key, None)
+                result.set_exception(e)
+        else:
+            _LOGGER.debug(f'[CollectCache] shared result => {key[1]}')
+
+        # Managers update items in place, every caller gets its own copy
+        return copy.deepcopy(result.result())
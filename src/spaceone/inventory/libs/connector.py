@@ -1,17 +1,77 @@
-import google.oauth2.service_account
-import googleapiclient
-import googleapiclient.discovery
+import functools
+import json
 import logging
+import concurrent.futures
 
 from spaceone.core.connector import BaseConnector
+from spaceone.inventory.libs.client_cache import client_cache
 
 DEFAULT_SCHEMA = 'google_oauth_client_id'
+# Google API batch endpoints accept up to 100 sub-requests per HTTP call
+MAX_BATCH_REQUESTS = 100
+# Instance groups listed at the same time by list_instance_group_members
+NUMBER_OF_CONCURRENT_GROUPS = 10
 _LOGGER = logging.getLogger(__name__)
 
 
+def cached_list(api_method):
+    """ Share the decorated list result through the collect cache
+
+    The key is built from the arguments of the caller, not from the request the method sends.
+    Methods decorated with same api_method must send the same request for the same arguments,
+    a method which adds its own filter needs its own api_method.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **query):
+            if self.collect_cache is None:
+                return func(self, *args, **query)
+
+            key = (self.project_id,
+                   f'{self.google_client_service}.{self.version}.{api_method}',
+                   json.dumps([args, query], sort_keys=True, default=str))
+            return self.collect_cache.get(key, lambda: func(self, *args, **query))
+        return wrapper
+    return decorator
+
+
+def cached_catalog(kind, shared=False):
+    """ Keep the decorated list result in the catalog cache across collects
+
+    Results of shared methods do not depend on the project of the connector, so every tenant shares them.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **query):
+            if self.catalog_cache is None:
+                return func(self, *args, **query)
+
+            key = json.dumps([None if shared else self.project_id, args, query], sort_keys=True, default=str)
+            return self.catalog_cache.get(kind, key, lambda: func(self, *args, **query))
+        return wrapper
+    return decorator
+
+
+def iter_pages(request, next_request):
+    """ Yield responses page by page, the next page is requested while the current one is processed
+
+    next_request: list_next or aggregatedList_next of the resource
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(request.execute) if request is not None else None
+        while future is not None:
+            response = future.result()
+            request = next_request(previous_request=request, previous_response=response)
+            future = executor.submit(request.execute) if request is not None else None
+            yield response
+
+
 class GoogleCloudConnector(BaseConnector):
     google_client_service = 'compute'
     version = 'v1'
+    collect_cache = None
+    catalog_cache = None
+    credentials = None
 
     def __init__(self, **kwargs):
         """
@@ -19,6 +79,8 @@ class GoogleCloudConnector(BaseConnector):
             - schema
             - options
             - secret_data
+            - collect_cache
+            - catalog_cache
 
         secret_data(dict)
             - type: ..
@@ -30,10 +92,11 @@ class GoogleCloudConnector(BaseConnector):
         super().__init__(transaction=None, config=None)
         secret_data = kwargs.get('secret_data')
         self.project_id = secret_data.get('project_id')
-        credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
-        self.client = googleapiclient.discovery.build(self.google_client_service,
-                                                      self.version,
-                                                      credentials=credentials)
+        self.collect_cache = kwargs.get('collect_cache')
+        self.catalog_cache = kwargs.get('catalog_cache')
+        # Clients are shared by every connector and thread, requests go on the keep-alive http of each thread
+        self.credentials = client_cache.get_credentials(secret_data)
+        self.client = client_cache.get_client(secret_data, self.google_client_service, self.version)
 
     def verify(self, **kwargs):
         if self.client is None:
@@ -45,6 +108,64 @@ class GoogleCloudConnector(BaseConnector):
         })
         return query
 
+    def iter_aggregated_list(self, resource, items_key, **query):
+        """ Yield items of aggregatedList page by page instead of collecting every page
+
+        resource: collection of the client such as self.client.instances()
+        """
+        query.update({'project': self.project_id})
+        for response in iter_pages(resource.aggregatedList(**query), resource.aggregatedList_next):
+            for scoped_list in response.get('items', {}).values():
+                yield from scoped_list.get(items_key, [])
+
+    def execute_batch(self, requests):
+        '''
+        Execute requests through the batch endpoint, MAX_BATCH_REQUESTS sub-requests per HTTP call
+        requests = {key: HttpRequest}
+
+        Return value is below, a failed sub-request has its exception as the value
+        {key: response | exception}
+        '''
+        responses = {}
+        keys = list(requests)
+
+        def _callback(request_id, response, exception):
+            responses[keys[int(request_id)]] = response if exception is None else exception
+
+        for offset in range(0, len(keys), MAX_BATCH_REQUESTS):
+            batch = self.client.new_batch_http_request(callback=_callback)
+            for idx in range(offset, min(offset + MAX_BATCH_REQUESTS, len(keys))):
+                batch.add(requests[keys[idx]], request_id=str(idx))
+            batch.execute()
+
+        return responses
+
+    def list_instance_group_members(self, instance_groups, max_workers=NUMBER_OF_CONCURRENT_GROUPS):
+        '''
+        Members of every instance group, listed concurrently
+        instance_groups = [(loc_type, location, instance_group_name)], loc_type is 'zone' or 'region'
+
+        Return value is below, a failed instance group has its exception as the value
+        {(loc_type, location, instance_group_name): [{'instance': 'self link', 'status': ''}, ...] | exception}
+        '''
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_members = {key: executor.submit(self.list_group_instances, *key) for key in set(instance_groups)}
+            concurrent.futures.wait(future_members.values())
+
+        return {key: future.exception() or future.result() for key, future in future_members.items()}
+
+    # Members are shared by the VM instance and instance group collects
+    @cached_list('instanceGroups.listInstances')
+    def list_group_instances(self, loc_type, location, instance_group_name, **query):
+        instance_list = []
+        query.update({'project': self.project_id, 'instanceGroup': instance_group_name, loc_type: location})
+        resource = self.client.instanceGroups() if loc_type == 'zone' else self.client.regionInstanceGroups()
+        for response in iter_pages(resource.listInstances(**query), resource.listInstances_next):
+            instance_list.extend(response.get('items', []))
+
+        return instance_list
+
+    @cached_catalog('zones')
     def list_zones(self, **query):
         query = self.generate_query(**query)
         result = self.client.zones().list(**query).execute()
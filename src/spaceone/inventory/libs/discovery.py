@@ -0,0 +1,32 @@
+import json
+import logging
+import threading
+
+import googleapiclient.discovery
+import googleapiclient.discovery_cache
+
+_LOGGER = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_discovery_documents = {}
+
+
+def get_discovery_document(api, version):
+    """ Discovery document bundled in google-api-python-client, parsed once per process
+
+    Returns None if the document is not bundled.
+    """
+    key = (api, version)
+    with _lock:
+        if key not in _discovery_documents:
+            content = googleapiclient.discovery_cache.get_static_doc(api, version)
+            _discovery_documents[key] = json.loads(content) if content else None
+        return _discovery_documents[key]
+
+
+def build_client(api, version, http):
+    if (document := get_discovery_document(api, version)) is not None:
+        return googleapiclient.discovery.build_from_document(document, http=http)
+
+    _LOGGER.debug(f'[build_client] no bundled discovery document => {api}.{version}')
+    return googleapiclient.discovery.build(api, version, http=http)
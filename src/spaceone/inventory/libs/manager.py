@@ -61,38 +61,31 @@ class GoogleCloudManager(BaseManager):
         for cloud_service_type in self.cloud_service_types:
             yield cloud_service_type
 
-    def collect_cloud_service(self, params) -> list:
+    def collect_cloud_service(self, params):
         raise NotImplemented
 
-    def collect_resources(self, params) -> list:
-        total_resources = []
-
+    def collect_resources(self, params):
+        """ Yield CloudServiceType, CloudService(or Error) and Region responses as they are built
+        """
         try:
-            # Collect Cloud Service Type3wee
-            total_resources.extend(self.collect_cloud_service_type())
+            # Collect Cloud Service Type
+            yield from self.collect_cloud_service_type()
 
             # Collect Cloud Service
-            resources, error_resources = self.collect_cloud_service(params)
-            total_resources.extend(resources)
-            total_resources.extend(error_resources)
+            yield from self.collect_cloud_service(params)
 
             # Collect Region
-            total_resources.extend(self.collect_region())
+            yield from self.collect_region()
 
         except Exception as e:
             _LOGGER.error(f'[collect_resources] {e}', exc_info=True)
             error_resource_response = self.generate_error_response(e, self.cloud_service_types[0].resource.group, self.cloud_service_types[0].resource.name)
-            total_resources.append(error_resource_response)
-
-        return total_resources
+            yield error_resource_response
 
     def collect_region(self):
-        results = []
-        for region_code in self.collected_region_codes:
+        for region_code in list(self.collected_region_codes):
             if region := self.match_region_info(region_code):
-                results.append(RegionResponse({'resource': region}))
-
-        return results
+                yield RegionResponse({'resource': region})
 
     def set_region_code(self, region):
         if region not in REGION_INFO:
@@ -113,6 +106,15 @@ class GoogleCloudManager(BaseManager):
             param = list_path[index_value]
         return param
 
+    @staticmethod
+    def get_batch_response(batch_responses, key):
+        """ Response of a batched sub-request, a failed sub-request raises its error for the resource
+        """
+        response = batch_responses.get(key)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
     @staticmethod
     def check_is_ipaddress(string_to_check):
         try:
@@ -1,10 +1,14 @@
 from schematics import Model
 from schematics.types import ListType, StringType, PolyModelType, DictType, ModelType
+from schematics.undefined import Undefined
 
 from spaceone.inventory.libs.schema.metadata.dynamic_layout import BaseLayoutField
 from spaceone.inventory.libs.schema.metadata.dynamic_search import BaseDynamicSearch
 from spaceone.inventory.libs.schema.metadata.dynamic_widget import BaseDynamicWidget
 
+# Serialized default metadata layouts by resource model class
+_METADATA_PRIMITIVES = {}
+
 
 class MetaDataViewSubData(Model):
     layouts = ListType(PolyModelType(BaseLayoutField))
@@ -32,6 +36,33 @@ class BaseResponse(Model):
     match_rules = DictType(ListType(StringType), serialize_when_none=False)
     resource = PolyModelType(Model, default={})
 
+    def to_primitive_with_cached_metadata(self, include_metadata=True):
+        """ to_primitive() which serializes the default metadata layouts once per resource model
+
+        Resources without a default _metadata(CloudServiceType, Region, Error) are serialized as is.
+        """
+        resource = self.resource
+        metadata_field = getattr(resource, '_fields', {}).get('_metadata')
+        if metadata_field is None or metadata_field.default in (None, Undefined) or resource._metadata is None:
+            return self.to_primitive()
+
+        metadata = resource._metadata
+        resource._metadata = None
+        try:
+            primitive = self.to_primitive()
+        finally:
+            resource._metadata = metadata
+
+        if include_metadata:
+            resource_class = type(resource)
+            if resource_class not in _METADATA_PRIMITIVES:
+                _METADATA_PRIMITIVES[resource_class] = metadata.to_primitive()
+            primitive['resource']['metadata'] = _METADATA_PRIMITIVES[resource_class]
+        else:
+            primitive['resource'].pop('metadata', None)
+
+        return primitive
+
 
 class ReferenceModel(Model):
     class Option:
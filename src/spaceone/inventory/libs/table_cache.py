@@ -0,0 +1,103 @@
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TABLE_CACHE_PATH = '/tmp/spaceone/google_cloud/bigquery_table_cache.db'
+DEFAULT_TABLE_CACHE_SIZE = 100000
+# Seconds to wait for a lock held by another collect sharing the file
+TABLE_CACHE_TIMEOUT = 5
+# Puts between evictions of least recently used entries
+EVICT_INTERVAL = 1000
+
+
+class TableCache(object):
+    """ Table details kept on disk across collects
+
+    key: (project_id, dataset_id, table_id)
+    An entry is valid while the validator(lastModifiedTime or etag) of the table is unchanged.
+    Least recently used entries over max_size are evicted every EVICT_INTERVAL puts and when the cache is closed.
+    SQLite errors(e.g. database is locked) are logged, a failed get is a miss and a failed put is skipped.
+    """
+
+    def __init__(self, path=DEFAULT_TABLE_CACHE_PATH, max_size=DEFAULT_TABLE_CACHE_SIZE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=TABLE_CACHE_TIMEOUT, check_same_thread=False)
+        self._conn.execute(f'PRAGMA busy_timeout = {TABLE_CACHE_TIMEOUT * 1000}')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS table_cache ('
+                           'project_id TEXT, dataset_id TEXT, table_id TEXT, validator TEXT, detail TEXT, '
+                           'accessed_at REAL, PRIMARY KEY (project_id, dataset_id, table_id))')
+        self._conn.commit()
+        self.max_size = max_size
+        self.puts = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get(self, key, validator):
+        with self._lock:
+            try:
+                row = self._conn.execute('SELECT validator, detail FROM table_cache '
+                                         'WHERE project_id = ? AND dataset_id = ? AND table_id = ?', key).fetchone()
+                if validator is None or row is None or row[0] != str(validator):
+                    self.misses += 1
+                    return None
+
+                self._conn.execute('UPDATE table_cache SET accessed_at = ? '
+                                   'WHERE project_id = ? AND dataset_id = ? AND table_id = ?', (time.time(), *key))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._rollback('get', e)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(row[1])
+
+    def put(self, key, validator, detail):
+        # Details without a validator can not be checked in the next collect
+        if validator is None:
+            return
+
+        with self._lock:
+            try:
+                self._conn.execute('INSERT OR REPLACE INTO table_cache VALUES (?, ?, ?, ?, ?, ?)',
+                                   (*key, str(validator), json.dumps(detail), time.time()))
+                self.puts += 1
+                if self.puts % EVICT_INTERVAL == 0:
+                    self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._rollback('put', e)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._rollback('close', e)
+            finally:
+                self._conn.close()
+
+        _LOGGER.debug(f'[TableCache] hits => {self.hits}, misses => {self.misses}, errors => {self.errors}')
+
+    def _evict(self):
+        # Called with the lock held
+        self._conn.execute('DELETE FROM table_cache WHERE rowid IN ('
+                           'SELECT rowid FROM table_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                           (self.max_size,))
+
+    def _rollback(self, operation, error):
+        # Called with the lock held
+        self.errors += 1
+        _LOGGER.error(f'[TableCache] {operation} skipped => {error}')
+        try:
+            self._conn.rollback()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,87 @@
+import logging
+import threading
+from collections import OrderedDict
+
+import httplib2
+import requests.adapters
+import google.auth.transport.requests
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every plugin API(compute, storage, bigquery, sqladmin, monitoring) is covered by cloud-platform scope
+CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+HTTP_TIMEOUT = 60
+# Service account keys whose sessions are kept by each thread
+MAX_THREAD_SESSIONS = 8
+
+_local = threading.local()
+
+
+class AuthorizedSessionHttp(object):
+    """ httplib2.Http interface for googleapiclient over an AuthorizedSession with keep-alive connection pools
+
+    requests.Session is not thread-safe, use get_authorized_http() to get the one of the calling thread.
+    """
+
+    def __init__(self, credentials):
+        self.session = google.auth.transport.requests.AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        response = self.session.request(method, uri, data=body, headers=headers, timeout=HTTP_TIMEOUT)
+        info = dict(response.headers)
+        info['status'] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        self.session.close()
+
+
+class ThreadLocalHttp(object):
+    """ httplib2.Http interface which sends each request on the keep-alive http of the calling thread
+
+    A discovery client built on it can be shared by every thread.
+    """
+
+    def __init__(self, credentials, refresh_credentials=None):
+        self.credentials = credentials
+        self.refresh_credentials = refresh_credentials
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        # Token is refreshed once for every thread, not by each session
+        if self.refresh_credentials is not None:
+            self.refresh_credentials(self.credentials)
+        return get_authorized_http(self.credentials).request(uri, method=method, body=body, headers=headers)
+
+
+def get_authorized_http(credentials):
+    """ Keep-alive http of the calling thread, shared by every connector with the same credentials
+
+    credentials must be scoped, CLOUD_PLATFORM_SCOPE covers every plugin API.
+    A session expires with its credentials, when the client cache builds new credentials of the same service
+    account key, the session of the old ones is closed and replaced.
+    Least recently used sessions over MAX_THREAD_SESSIONS are closed.
+    """
+    authorized_https = _local.__dict__.setdefault('authorized_https', OrderedDict())
+    key = (credentials.service_account_email, getattr(credentials.signer, 'key_id', None))
+    if key in authorized_https:
+        session_credentials, authorized_http = authorized_https[key]
+        if session_credentials is credentials:
+            authorized_https.move_to_end(key)
+            return authorized_http
+
+        del authorized_https[key]
+        authorized_http.close()
+
+    authorized_http = AuthorizedSessionHttp(credentials)
+    authorized_https[key] = (credentials, authorized_http)
+    while len(authorized_https) > MAX_THREAD_SESSIONS:
+        _, (_, dropped_http) = authorized_https.popitem(last=False)
+        dropped_http.close()
+
+    return authorized_http
@@ -1,15 +1,54 @@
+import re
+import copy
+import json
 import logging
 import time
 
 from spaceone.inventory.libs.manager import GoogleCloudManager
 from spaceone.inventory.libs.schema.base import ReferenceModel
 from spaceone.inventory.model.bigquery.cloud_service import *
+from spaceone.inventory.libs.table_cache import TableCache, DEFAULT_TABLE_CACHE_PATH, DEFAULT_TABLE_CACHE_SIZE
 from spaceone.inventory.connector.big_query import BigQueryConnector
 from spaceone.inventory.model.bigquery.cloud_service_type import CLOUD_SERVICE_TYPES
 from datetime import datetime
 
 _LOGGER = logging.getLogger(__name__)
 
+# Partial response masks, datasets and tables are detailed by get or INFORMATION_SCHEMA
+DATASET_LIST_FIELDS = 'datasets(datasetReference,location),nextPageToken'
+TABLE_LIST_FIELDS = 'tables(tableReference),nextPageToken'
+
+# GoogleSQL type of INFORMATION_SCHEMA.COLUMNS => legacy type of tables.get schema
+LEGACY_TYPE_MAP = {
+    'INT64': 'INTEGER',
+    'FLOAT64': 'FLOAT',
+    'BOOL': 'BOOLEAN',
+    'STRUCT': 'RECORD'
+}
+
+# INFORMATION_SCHEMA.TABLE_OPTIONS option_name => tables.get key
+TABLE_OPTION_MAP = {
+    'friendly_name': 'friendlyName',
+    'description': 'description',
+    'expiration_timestamp': 'expirationTime',
+    'labels': 'labels'
+}
+
+RANGE_PARTITIONING = re.compile(r'PARTITION BY RANGE_BUCKET\((?P<field>[^,]+),\s*GENERATE_ARRAY\('
+                                r'(?P<start>-?\d+),\s*(?P<end>-?\d+),\s*(?P<interval>-?\d+)\)\)')
+TIMESTAMP_OPTION = re.compile(r'^TIMESTAMP\s+"(?P<timestamp>[^"]+)"$')
+LABEL_OPTION = re.compile(r'STRUCT\(\s*"(?P<key>[^"]*)",\s*"(?P<value>[^"]*)"\s*\)')
+
+# INFORMATION_SCHEMA.TABLES table_type => tables.get type
+TABLE_TYPE_MAP = {
+    'BASE TABLE': 'TABLE',
+    'VIEW': 'VIEW',
+    'MATERIALIZED VIEW': 'MATERIALIZED_VIEW',
+    'EXTERNAL': 'EXTERNAL',
+    'SNAPSHOT': 'SNAPSHOT',
+    'CLONE': 'TABLE'
+}
+
 
 class BigQueryManager(GoogleCloudManager):
     connector_name = 'BigQueryConnector'
@@ -30,17 +69,35 @@ class BigQueryManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
-        data_set_id = ""
-
         secret_data = params['secret_data']
         project_id = secret_data['project_id']
         big_query_conn: BigQueryConnector = self.locator.get_connector(self.connector_name, **params)
 
-        data_sets = big_query_conn.list_dataset()
+        data_sets = big_query_conn.list_dataset(fields=DATASET_LIST_FIELDS)
         projects = big_query_conn.list_projects()
+        bq_datasets = self._get_datasets(big_query_conn, data_sets)
+
+        # Table details of each dataset region from INFORMATION_SCHEMA, the others are fetched per table
+        table_details = {}
+        if params.get('options', {}).get('bigquery_table_metadata') == 'information_schema':
+            table_details = self._get_table_details_from_information_schema(big_query_conn, project_id, data_sets)
+
+        # Table details of unchanged tables from the previous collects
+        table_cache = self._get_table_cache(params.get('options', {}))
+        table_validators = self._get_table_validators(big_query_conn, data_sets) if table_cache is not None else {}
 
+        try:
+            yield from self._collect_data_sets(big_query_conn, project_id, data_sets, projects, bq_datasets,
+                                               table_details, table_cache, table_validators)
+        finally:
+            if table_cache is not None:
+                table_cache.close()
+
+        _LOGGER.debug(f'** Big Query Finished {time.time() - start_time} Seconds **')
+
+    def _collect_data_sets(self, big_query_conn, project_id, data_sets, projects, bq_datasets, table_details,
+                           table_cache, table_validators):
+        data_set_id = ""
         update_bq_dt_tables = []
         table_schemas = []
 
@@ -49,11 +106,20 @@ class BigQueryManager(GoogleCloudManager):
                 data_refer = data_set.get('datasetReference', {})
                 data_set_id = data_refer.get('datasetId')
                 dataset_project_id = data_refer.get('projectId')
-                bq_dataset = big_query_conn.get_dataset(data_set_id)
+                bq_dataset = self.get_batch_response(bq_datasets, data_set_id) if data_set_id in bq_datasets \
+                    else big_query_conn.get_dataset(data_set_id)
                 # skip if dataset id is invisible
                 if self.get_visible_on_console(data_set_id):
-                    bq_dt_tables = big_query_conn.list_tables(data_set_id)
-                    update_bq_dt_tables, table_schemas = self._get_table_list_with_schema(big_query_conn, bq_dt_tables)
+                    bq_dt_tables = big_query_conn.list_tables(data_set_id, fields=TABLE_LIST_FIELDS)
+                    validators = {}
+                    dataset_table_details = table_details
+                    if table_cache is not None:
+                        validators = table_validators.get(data_set_id, {})
+                        dataset_table_details = {**self._get_cached_tables(table_cache, bq_dt_tables, validators),
+                                                 **table_details}
+                    update_bq_dt_tables, table_schemas = self._get_table_list_with_schema(big_query_conn, bq_dt_tables,
+                                                                                          dataset_table_details,
+                                                                                          table_cache, validators)
 
                 matched_projects = self._get_matching_project(dataset_project_id, projects)
 
@@ -103,14 +169,11 @@ class BigQueryManager(GoogleCloudManager):
                     'reference': ReferenceModel(big_query_data.reference())
                 })
                 self.set_region_code(region)
-                collected_cloud_services.append(SQLWorkSpaceResponse({'resource': big_query_work_space_resource}))
+                yield SQLWorkSpaceResponse({'resource': big_query_work_space_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'BigQuery', 'SQLWorkspace', data_set_id)
-                error_responses.append(error_response)
-
-        _LOGGER.debug(f'** Big Query Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
+                yield error_response
 
     def get_region(self, location):
         matched_info = self.match_region_info(location)
@@ -143,6 +206,234 @@ class BigQueryManager(GoogleCloudManager):
                 _projects.append(ProjectModel(project, strict=False))
         return _projects
 
+    @staticmethod
+    def _get_datasets(big_query_conn, data_sets):
+        # Datasets missing from a failed batch are fetched one by one
+        try:
+            return big_query_conn.batch_get_dataset([data_set.get('datasetReference', {}).get('datasetId')
+                                                     for data_set in data_sets])
+        except Exception as e:
+            _LOGGER.error(f'[_get_datasets] => {e}', exc_info=True)
+            return {}
+
+    def _get_table_details_from_information_schema(self, big_query_conn, project_id, data_sets):
+        '''
+        Return value is below, it has the same form with tables.get
+        {('dataset_id', 'table_id'): table}
+        '''
+        table_details = {}
+        for location, dataset_ids in self._get_dataset_ids_by_location(data_sets).items():
+            try:
+                tables = big_query_conn.query_information_schema('TABLES', location,
+                                                                 ['table_schema', 'table_name', 'table_type',
+                                                                  'creation_time', 'ddl'])
+                columns = big_query_conn.query_information_schema('COLUMNS', location,
+                                                                  ['table_schema', 'table_name', 'column_name',
+                                                                   'data_type', 'is_nullable', 'ordinal_position'])
+                storages = big_query_conn.query_information_schema('TABLE_STORAGE', location,
+                                                                   ['table_schema', 'table_name', 'total_rows'])
+                table_options = big_query_conn.query_information_schema('TABLE_OPTIONS', location,
+                                                                        ['table_schema', 'table_name', 'option_name',
+                                                                         'option_value'])
+                views = big_query_conn.query_information_schema('VIEWS', location,
+                                                                ['table_schema', 'table_name', 'view_definition',
+                                                                 'use_standard_sql'])
+                # INFORMATION_SCHEMA has no last modified time of table metadata
+                last_modified_times = big_query_conn.list_tables_last_modified_times(dataset_ids, location)
+            except Exception as e:
+                _LOGGER.error(f'[_get_table_details_from_information_schema] {location} => {e}', exc_info=True)
+                continue
+
+            table_details.update(self._join_information_schema(project_id, tables, columns, storages, table_options,
+                                                               views, last_modified_times))
+
+        return table_details
+
+    def _join_information_schema(self, project_id, tables, columns, storages, table_options=None, views=None,
+                                 last_modified_times=None):
+        table_details = {}
+        for table in tables:
+            dataset_id = table.get('table_schema')
+            table_id = table.get('table_name')
+            creation_time = table.get('creation_time')
+            table_detail = {
+                'kind': 'bigquery#table',
+                'id': f'{project_id}:{dataset_id}.{table_id}',
+                'tableReference': {'projectId': project_id, 'datasetId': dataset_id, 'tableId': table_id},
+                'type': TABLE_TYPE_MAP.get(table.get('table_type'), table.get('table_type')),
+                # TIMESTAMP is returned as seconds, tables.get returns milliseconds
+                'creationTime': str(int(float(creation_time) * 1000)) if creation_time else None,
+                'schema': {'fields': []}
+            }
+
+            if range_partitioning := self._get_range_partitioning(table.get('ddl') or ''):
+                table_detail['rangePartitioning'] = range_partitioning
+
+            if last_modified_time := (last_modified_times or {}).get((dataset_id, table_id)):
+                table_detail['lastModifiedTime'] = str(last_modified_time)
+
+            table_details[(dataset_id, table_id)] = table_detail
+
+        for column in sorted(columns, key=lambda c: int(c.get('ordinal_position') or 0)):
+            if table := table_details.get((column.get('table_schema'), column.get('table_name'))):
+                mode = 'NULLABLE' if column.get('is_nullable') == 'YES' else 'REQUIRED'
+                table['schema']['fields'].append(self._get_schema_field(column.get('column_name'),
+                                                                        column.get('data_type', ''), mode))
+
+        for storage in storages:
+            if table := table_details.get((storage.get('table_schema'), storage.get('table_name'))):
+                table['numRows'] = storage.get('total_rows')
+
+        for table_option in table_options or []:
+            table = table_details.get((table_option.get('table_schema'), table_option.get('table_name')))
+            option_key = TABLE_OPTION_MAP.get(table_option.get('option_name'))
+            if table is not None and option_key is not None:
+                table[option_key] = self._get_table_option_value(table_option.get('option_value') or '')
+
+        for view in views or []:
+            if table := table_details.get((view.get('table_schema'), view.get('table_name'))):
+                table['view'] = {'query': view.get('view_definition'),
+                                 'useLegacySql': view.get('use_standard_sql') == 'NO'}
+
+        # tables.get has no schema for a table without columns
+        for table in table_details.values():
+            if not table['schema']['fields']:
+                table.pop('schema')
+
+        return table_details
+
+    def _get_schema_field(self, name, data_type, mode):
+        '''
+        GoogleSQL type of INFORMATION_SCHEMA.COLUMNS => schema field of tables.get
+        ARRAY<STRUCT<a INT64, b STRING>> => {'name': name, 'type': 'RECORD', 'mode': 'REPEATED',
+                                             'fields': [{'name': 'a', 'type': 'INTEGER', 'mode': 'NULLABLE'}, ...]}
+        '''
+        data_type = data_type.strip()
+        if data_type.endswith(' NOT NULL'):
+            data_type, mode = data_type[:-len(' NOT NULL')].strip(), 'REQUIRED'
+
+        if data_type.startswith('ARRAY<'):
+            data_type, mode = data_type[len('ARRAY<'):-1].strip(), 'REPEATED'
+
+        if not data_type.startswith('STRUCT<'):
+            # Parameterized types such as STRING(10) or NUMERIC(10, 2) have the base type
+            base_type = data_type.split('(')[0].strip()
+            return {'name': name, 'type': LEGACY_TYPE_MAP.get(base_type, base_type), 'mode': mode}
+
+        fields = []
+        for struct_field in self._split_struct_fields(data_type[len('STRUCT<'):-1]):
+            if struct_field.startswith('`'):
+                field_name, _, field_type = struct_field[1:].partition('`')
+            else:
+                field_name, _, field_type = struct_field.partition(' ')
+            fields.append(self._get_schema_field(field_name, field_type, 'NULLABLE'))
+
+        return {'name': name, 'type': 'RECORD', 'mode': mode, 'fields': fields}
+
+    @staticmethod
+    def _split_struct_fields(struct_fields):
+        # Commas of nested STRUCT, ARRAY and type parameters do not split fields
+        fields = []
+        depth = 0
+        start = 0
+        for idx, char in enumerate(struct_fields):
+            if char in '<(':
+                depth += 1
+            elif char in '>)':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                fields.append(struct_fields[start:idx].strip())
+                start = idx + 1
+
+        fields.append(struct_fields[start:].strip())
+        return [field for field in fields if field]
+
+    @staticmethod
+    def _get_range_partitioning(ddl):
+        '''
+        PARTITION BY RANGE_BUCKET(customer_id, GENERATE_ARRAY(0, 100, 10))
+        => {'field': 'customer_id', 'range': {'start': '0', 'end': '100', 'interval': '10'}}
+        '''
+        if matched := RANGE_PARTITIONING.search(ddl):
+            return {'field': matched.group('field').strip('`'),
+                    'range': {'start': matched.group('start'), 'end': matched.group('end'),
+                              'interval': matched.group('interval')}}
+        return None
+
+    @staticmethod
+    def _get_table_option_value(option_value):
+        '''
+        "name" => name, TIMESTAMP "2022-01-01T00:00:00.000Z" => '1640995200000'(milliseconds like tables.get),
+        [STRUCT("team", "sales")] => {'team': 'sales'}
+        '''
+        if matched := TIMESTAMP_OPTION.match(option_value):
+            timestamp = datetime.fromisoformat(matched.group('timestamp').replace('Z', '+00:00'))
+            return str(int(timestamp.timestamp() * 1000))
+
+        if option_value.startswith('[STRUCT('):
+            return {matched.group('key'): matched.group('value') for matched in LABEL_OPTION.finditer(option_value)}
+
+        try:
+            return json.loads(option_value)
+        except ValueError:
+            return option_value
+
+    @staticmethod
+    def _get_table_cache(options):
+        if not options.get('bigquery_table_cache', False):
+            return None
+
+        try:
+            return TableCache(options.get('bigquery_table_cache_path', DEFAULT_TABLE_CACHE_PATH),
+                              options.get('bigquery_table_cache_size', DEFAULT_TABLE_CACHE_SIZE))
+        except Exception as e:
+            _LOGGER.error(f'[_get_table_cache] collect without table cache => {e}', exc_info=True)
+            return None
+
+    def _get_table_validators(self, big_query_conn, data_sets):
+        '''
+        last_modified_time of each table to check the cached details
+        tables.list does not return it, so __TABLES__ of every visible dataset is queried once per location
+        Return value is below
+        {'dataset_id': {'table_id': validator}}
+        '''
+        validators = {}
+        visible_data_sets = [data_set for data_set in data_sets
+                             if self.get_visible_on_console(data_set.get('datasetReference', {}).get('datasetId'))]
+        for location, dataset_ids in self._get_dataset_ids_by_location(visible_data_sets).items():
+            try:
+                last_modified_times = big_query_conn.list_tables_last_modified_times(dataset_ids, location)
+            except Exception as e:
+                _LOGGER.error(f'[_get_table_validators] {location} => {e}', exc_info=True)
+                continue
+
+            for (dataset_id, table_id), last_modified_time in last_modified_times.items():
+                validators.setdefault(dataset_id, {})[table_id] = last_modified_time
+
+        return validators
+
+    @staticmethod
+    def _get_dataset_ids_by_location(data_sets):
+        dataset_ids_by_location = {}
+        for data_set in data_sets:
+            if location := data_set.get('location'):
+                dataset_ids_by_location.setdefault(location, []).append(
+                    data_set.get('datasetReference', {}).get('datasetId'))
+
+        return dataset_ids_by_location
+
+    @staticmethod
+    def _get_cached_tables(table_cache, bq_dt_tables, validators):
+        cached_tables = {}
+        for bq_dt_table in bq_dt_tables:
+            table_ref = bq_dt_table.get('tableReference', {})
+            table_id = table_ref.get('tableId')
+            cache_key = (table_ref.get('projectId'), table_ref.get('datasetId'), table_id)
+            if (cached_table := table_cache.get(cache_key, validators.get(table_id))) is not None:
+                cached_tables[(table_ref.get('datasetId'), table_id)] = cached_table
+
+        return cached_tables
+
     @staticmethod
     def get_visible_on_console(dataset_id):
         return False if dataset_id.startswith('_') else True
@@ -151,12 +442,52 @@ class BigQueryManager(GoogleCloudManager):
     TODO:  
     '''
     @staticmethod
-    def _get_table_list_with_schema(big_conn: BigQueryConnector, bq_dt_tables):
+    def _get_tables(big_conn, dataset_id, table_ids):
+        '''
+        Tables missing from a failed batch are fetched one by one
+        Return value is below
+        {'table_id': table | exception}
+        '''
+        try:
+            tables = big_conn.batch_get_tables(dataset_id, table_ids)
+        except Exception as e:
+            _LOGGER.error(f'[_get_tables] {dataset_id} => {e}', exc_info=True)
+            tables = {}
+
+        for table_id in table_ids:
+            if table_id not in tables:
+                try:
+                    tables[table_id] = big_conn.get_tables(dataset_id, table_id)
+                except Exception as e:
+                    tables[table_id] = e
+
+        return tables
+
+    @staticmethod
+    def _get_table_list_with_schema(big_conn: BigQueryConnector, bq_dt_tables, table_details=None, table_cache=None,
+                                    validators=None):
         update_bq_dt_tables = []
         table_schemas = []
-        for bq_dt_table in bq_dt_tables:
-            table_ref = bq_dt_table.get('tableReference')
-            table_single = big_conn.get_tables(table_ref.get('datasetId'), table_ref.get('tableId'))
+        table_details = table_details or {}
+        table_refs = [bq_dt_table.get('tableReference') for bq_dt_table in bq_dt_tables]
+        # Tables listed from a dataset share the datasetId
+        missing_table_ids = [table_ref.get('tableId') for table_ref in table_refs
+                             if (table_ref.get('datasetId'), table_ref.get('tableId')) not in table_details]
+        batch_tables = BigQueryManager._get_tables(big_conn, table_refs[0].get('datasetId'), missing_table_ids) \
+            if missing_table_ids else {}
+
+        if table_cache is not None:
+            validators = validators or {}
+            for table_ref in table_refs:
+                table_id = table_ref.get('tableId')
+                if table_id in batch_tables and not isinstance(batch_tables[table_id], Exception):
+                    table_cache.put((table_ref.get('projectId'), table_ref.get('datasetId'), table_id),
+                                    validators.get(table_id), batch_tables[table_id])
+
+        for table_ref in table_refs:
+            table_key = (table_ref.get('datasetId'), table_ref.get('tableId'))
+            table_single = copy.deepcopy(table_details[table_key]) if table_key in table_details \
+                else GoogleCloudManager.get_batch_response(batch_tables, table_ref.get('tableId'))
 
             if table_single is not None:
                 creationTime = table_single.get('creationTime')
@@ -30,8 +30,6 @@ class CloudSQLManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         instance_name = ""
         secret_data = params['secret_data']
         project_id = secret_data['project_id']
@@ -39,6 +37,11 @@ class CloudSQLManager(GoogleCloudManager):
         cloud_sql_conn: CloudSQLConnector = self.locator.get_connector(self.connector_name, **params)
         instances = cloud_sql_conn.list_instances()
 
+        # Get Databases & Users of available instances in batches
+        available_instance_names = [instance['name'] for instance in instances
+                                    if self._check_sql_instance_is_available(instance)]
+        batch_databases, batch_users = self._get_databases_and_users(cloud_sql_conn, available_instance_names)
+
         for instance in instances:
             try:
                 _LOGGER.debug(f'[collect_cloud_service] instance => {instance}')
@@ -47,8 +50,10 @@ class CloudSQLManager(GoogleCloudManager):
                 # Get Databases & Users, If SQL instance is not available skip, Database/User check.
                 # Otherwise, It occurs error while list databases, list users.
                 if self._check_sql_instance_is_available(instance):
-                    databases = cloud_sql_conn.list_databases(instance_name)
-                    users = cloud_sql_conn.list_users(instance_name)
+                    databases = self.get_batch_response(batch_databases, instance_name) \
+                        if instance_name in batch_databases else cloud_sql_conn.list_databases(instance_name)
+                    users = self.get_batch_response(batch_users, instance_name) \
+                        if instance_name in batch_users else cloud_sql_conn.list_users(instance_name)
                 else:
                     databases = []
                     users = []
@@ -71,15 +76,29 @@ class CloudSQLManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(instance['region'])
-                collected_cloud_services.append(InstanceResponse({'resource': instance_resource}))
+                yield InstanceResponse({'resource': instance_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 # Database Instance name is key(= instance_id)
                 error_response = self.generate_resource_error_response(e, 'CloudSQL', 'Instance', instance_name)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Cloud SQL Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
+
+    @staticmethod
+    def _get_databases_and_users(cloud_sql_conn, instance_names):
+        # Instances missing from a failed batch get their databases and users one by one
+        try:
+            return cloud_sql_conn.batch_list_databases(instance_names), cloud_sql_conn.batch_list_users(instance_names)
+        except Exception as e:
+            _LOGGER.error(f'[_get_databases_and_users] => {e}', exc_info=True)
+            return {}, {}
+
+    @staticmethod
+    def _check_sql_instance_is_available(instance):
+        # Databases and users can not be listed while the instance is not runnable or stopped
+        return instance.get('state') == 'RUNNABLE' and \
+            instance.get('settings', {}).get('activationPolicy') != 'NEVER'
 
     @staticmethod
     def get_stackdriver(project, name):
@@ -31,8 +31,6 @@ class DiskManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         disk_id = ""
 
         secret_data = params['secret_data']
@@ -81,14 +79,13 @@ class DiskManager(GoogleCloudManager):
                     'reference': ReferenceModel(disk_data.reference())
                 })
                 self.set_region_code(disk['region'])
-                collected_cloud_services.append(DiskResponse({'resource': disk_resource}))
+                yield DiskResponse({'resource': disk_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'Disk', disk_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Disk Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_iops_rate(self, disk_type, disk_size, flag):
         const = self._get_iops_constant(disk_type, flag)
@@ -29,8 +29,6 @@ class ExternalIPAddressManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         external_ip_addr_id = ""
 
         secret_data = params['secret_data']
@@ -70,14 +68,13 @@ class ExternalIPAddressManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(region)
-                collected_cloud_services.append(ExternalIpAddressResponse({'resource': external_ip_addr_resource}))
+                yield ExternalIpAddressResponse({'resource': external_ip_addr_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'VPC', 'ExternalIPAddress', external_ip_addr_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** External IP Address Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_external_ip_addresses(self, regional_address, instances_over_region, forwarding_rules):
 
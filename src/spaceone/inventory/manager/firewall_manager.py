@@ -29,8 +29,6 @@ class FirewallManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         firewall_id = ""
 
         secret_data = params['secret_data']
@@ -87,14 +85,13 @@ class FirewallManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(region)
-                collected_cloud_services.append(FirewallResponse({'resource': firewall_resource}))
+                yield FirewallResponse({'resource': firewall_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'VPC', 'Firewall', firewall_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Firewall Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
 
     @staticmethod
@@ -28,8 +28,6 @@ class HealthCheckManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         health_check_id = ""
         secret_data = params['secret_data']
         project_id = secret_data['project_id']
@@ -49,14 +47,13 @@ class HealthCheckManager(GoogleCloudManager):
                     'data': health_check_data,
                     'reference': ReferenceModel(health_check_data.reference())
                 })
-                collected_cloud_services.append(HealthCheckResponse({'resource': health_check_resource}))
+                yield HealthCheckResponse({'resource': health_check_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'HealthCheck', health_check_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** HealthCheck Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     @staticmethod
     def get_stackdriver(project, name):
@@ -29,8 +29,6 @@ class InstanceGroupManager(GoogleCloudManager):
         Response:
             CloudServiceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         instance_group_id = ""
 
         secret_data = params['secret_data']
@@ -42,6 +40,10 @@ class InstanceGroupManager(GoogleCloudManager):
         instance_group_managers = instance_group_conn.list_instance_group_managers()
         autoscalers = instance_group_conn.list_autoscalers()
         instance_templates = instance_group_conn.list_instance_templates()
+        # Members of every instance group are listed concurrently, the VM instance collect shares them
+        instance_group_members = instance_group_conn.list_instance_group_members(
+            [(*self.get_instance_group_loc(instance_group), instance_group.get('name'))
+             for instance_group in instance_groups])
 
         for instance_group in instance_groups:
             try:
@@ -93,7 +95,8 @@ class InstanceGroupManager(GoogleCloudManager):
 
                 loc_type, location = self.get_instance_group_loc(instance_group)
                 region = self.parse_region_from_zone(location) if loc_type == 'zone' else location
-                instances = instance_group_conn.list_instances(instance_group.get('name'), location, loc_type)
+                instances = self.get_batch_response(instance_group_members,
+                                                    (loc_type, location, instance_group.get('name')))
 
                 display_loc = {'region': location, 'zone': ''} if loc_type == 'region' \
                     else {'region': location[:-2], 'zone': location}
@@ -117,14 +120,13 @@ class InstanceGroupManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(region)
-                collected_cloud_services.append(InstanceGroupResponse({'resource': instance_group_resource}))
+                yield InstanceGroupResponse({'resource': instance_group_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'InstanceGroup', instance_group_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Instance Group Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_instance_group_loc(self, instance_group):
         inst_type = 'zone' if 'zone' in instance_group else 'region'
@@ -29,8 +29,6 @@ class InstanceTemplateManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         inst_template_id = ""
 
         secret_data = params['secret_data']
@@ -85,14 +83,13 @@ class InstanceTemplateManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(default_region)
-                collected_cloud_services.append(InstanceTemplateResponse({'resource': instance_template_resource}))
+                yield InstanceTemplateResponse({'resource': instance_template_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'InstanceTemplate', inst_template_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Instance Template Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     # Returns matched instance group and user(instance) related to instance template.
     def match_instance_group(self, instance_template, instance_group_managers: list):
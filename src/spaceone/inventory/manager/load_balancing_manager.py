@@ -28,8 +28,6 @@ class LoadBalancingManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
         lb_id = ""
 
         secret_data = params['secret_data']
@@ -90,20 +88,31 @@ class LoadBalancingManager(GoogleCloudManager):
         target_pool_based_load_balancers = self._get_loadbalancer_from_forwarding_rule(forwarding_rules)
         load_balancers.extend(target_pool_based_load_balancers)
 
+        # Components are indexed once by selfLink and target, each load balancer looks up only its own
+        forwarding_rule_index = self._get_forwarding_rule_index(forwarding_rules)
+        certificate_index = self._get_self_link_index(ssl_certificates)
+        url_map_index = {url_map.get('selfLink'): url_map for url_map in url_maps}
+        backend_service_index = self._get_self_link_index(backend_services)
+        health_check_index = self._get_self_link_index(health_checks)
+        legacy_health_check_index = self._get_self_link_index(legacy_health_checks)
+        backend_bucket_index = self._get_self_link_index(backend_buckets)
+        target_pool_index = self._get_self_link_index(target_pools)
+
         for load_balancer in load_balancers:
             try:
                 ##################################
                 # 0. Set Basic Information
                 ##################################
-                lb_forwarding_rules = self._get_forwarding_rules(load_balancer, forwarding_rules)
+                lb_forwarding_rules = self._get_forwarding_rules(load_balancer, forwarding_rule_index)
                 lb_target_proxy = self._get_target_proxy(load_balancer)
-                lb_certificates = self._get_certificates(lb_target_proxy, ssl_certificates)
-                lb_urlmap = self._get_urlmap(load_balancer, url_maps)
-                lb_backend_services = self._get_backend_services(lb_urlmap, backend_services)
-                lb_health_checks = self._get_health_checks(lb_backend_services, health_checks)
-                lb_legacy_health_checks = self._get_legacy_health_checks(lb_backend_services, legacy_health_checks)
-                lb_bucket_services = self._get_bucket_services(lb_urlmap, backend_buckets)
-                lb_target_pools = self._get_target_pools(lb_forwarding_rules, target_pools)
+                lb_certificates = self._get_certificates(lb_target_proxy, certificate_index)
+                lb_urlmap = self._get_urlmap(load_balancer, url_map_index)
+                lb_backend_services = self._get_backend_services(lb_urlmap, backend_service_index)
+                lb_health_checks = self._get_health_checks(lb_backend_services, health_check_index)
+                lb_legacy_health_checks = self._get_legacy_health_checks(lb_backend_services,
+                                                                         legacy_health_check_index)
+                lb_bucket_services = self._get_bucket_services(lb_urlmap, backend_bucket_index)
+                lb_target_pools = self._get_target_pools(lb_forwarding_rules, target_pool_index)
 
                 ##################################
                 # 1. Make Base Data
@@ -144,14 +153,13 @@ class LoadBalancingManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(loadbalancer_data.get('region', ''))
-                collected_cloud_services.append(LoadBalancingResponse({'resource': loadbalancer_resource}))
+                yield LoadBalancingResponse({'resource': loadbalancer_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'NetworkService', 'LoadBalancing', lb_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Load Balancing Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
 
     def _get_loadbalancer_from_forwarding_rule(self, forwarding_rules) -> list:
@@ -242,106 +250,101 @@ class LoadBalancingManager(GoogleCloudManager):
         return proxy_type
 
 
-    @staticmethod
-    def _get_certificates(lb_target_proxy, ssl_certificates) -> list:
+    def _get_certificates(self, lb_target_proxy, certificate_index) -> list:
         """
         Get related certificated to target proxy(LoadBalancer)
         """
-        matched_certificates = []
-        for cert in ssl_certificates:
-            if cert.get('selfLink', '') in lb_target_proxy.get('sslCertificates', []):
-                matched_certificates.append(cert)
-        return matched_certificates
+        return self._get_by_self_links(certificate_index, lb_target_proxy.get('sslCertificates', []))
 
     @staticmethod
-    def _get_urlmap(load_balancer, url_maps):
+    def _get_urlmap(load_balancer, url_map_index):
         """
         Get relatred urlmaps to loadbalancer
         """
-        matched_urlmap = {}
-        for map in url_maps:
-            if map.get('selfLink') == load_balancer.get('urlMap', ''):
-                matched_urlmap = map
-
-        return matched_urlmap
+        return url_map_index.get(load_balancer.get('urlMap', ''), {})
 
-    @staticmethod
-    def _get_backend_services(lb_urlmap, backend_services):
+    def _get_backend_services(self, lb_urlmap, backend_service_index):
         """
         Get related backend services from urlmap
         """
-        matched_backend_services = []
-        for svc in backend_services:
-            if lb_urlmap.get('defaultService', '') == svc.get('selfLink'):
-                matched_backend_services.append(svc)
-
-        return matched_backend_services
+        return self._get_by_self_links(backend_service_index, [lb_urlmap.get('defaultService', '')])
 
-    @staticmethod
-    def _get_health_checks(lb_backend_services, health_checks):
+    def _get_health_checks(self, lb_backend_services, health_check_index):
         """
         Get related health checks from backend_services
         """
         matched_health_checks = []
         for svc in lb_backend_services:
-            for check in health_checks:
-                if check.get('selfLink') in svc.get('healthChecks', []):
-                    matched_health_checks.append(check)
+            matched_health_checks.extend(self._get_by_self_links(health_check_index, svc.get('healthChecks', [])))
 
         return matched_health_checks
 
-    @staticmethod
-    def _get_legacy_health_checks(lb_backend_services, legacy_health_checks):
+    def _get_legacy_health_checks(self, lb_backend_services, legacy_health_check_index):
         """
         Get related legacy health checks from backend_services
         """
         matched_legacy_health_checks = []
         for svc in lb_backend_services:
-            for check in legacy_health_checks:
-                if check.get('selfLink') in svc.get('healthChecks', []):
-                    matched_legacy_health_checks.append(check)
+            matched_legacy_health_checks.extend(self._get_by_self_links(legacy_health_check_index,
+                                                                        svc.get('healthChecks', [])))
 
         return matched_legacy_health_checks
 
-    @staticmethod
-    def _get_bucket_services(lb_urlmap, backend_buckets):
+    def _get_bucket_services(self, lb_urlmap, backend_bucket_index):
         """
         Get related bucket backend from urlmaps
         """
-        matched_bucket_service = []
-        for backend in backend_buckets:
-            if backend.get('selfLink') in lb_urlmap.get('defaultService', ''):
-                matched_bucket_service.append(backend)
-
-        return matched_bucket_service
+        return self._get_by_self_links(backend_bucket_index, [lb_urlmap.get('defaultService', '')])
 
-    @staticmethod
-    def _get_target_pools(lb_forwarding_rules, target_pools):
+    def _get_target_pools(self, lb_forwarding_rules, target_pool_index):
         """
         Get related target pool from forwarding rules
         """
         matched_target_pools = []
         for rule in lb_forwarding_rules:
-            for pool in target_pools:
-                if rule.get('target', '') == pool.get('selfLink'):
-                    matched_target_pools.append(pool)
+            matched_target_pools.extend(self._get_by_self_links(target_pool_index, [rule.get('target', '')]))
 
         return matched_target_pools
 
     @staticmethod
-    def _get_forwarding_rules(loadbalancer, forwarding_rules):
-        matched_forwarding_rules = []
+    def _get_forwarding_rules(loadbalancer, forwarding_rule_index):
         '''
         1. LoadBalancer is target of forwarding rule
         2. LoadBalancer is same as forwarding rules(Target Pool Based)
         '''
+        return list(forwarding_rule_index.get(loadbalancer.get('selfLink'), []))
+
+    @staticmethod
+    def _get_forwarding_rule_index(forwarding_rules) -> dict:
+        '''
+        Forwarding rules by their target and by their own selfLink
+        Return value is below
+        {'target or self link': [forwarding_rule, ...]}
+        '''
+        forwarding_rule_index = {}
         for rule in forwarding_rules:
-            if loadbalancer.get('selfLink') == rule.get('target', ''):
-                matched_forwarding_rules.append(rule)
-            if loadbalancer.get('selfLink') == rule.get('selfLink', ''):
-                matched_forwarding_rules.append(rule)
+            forwarding_rule_index.setdefault(rule.get('target', ''), []).append(rule)
+            forwarding_rule_index.setdefault(rule.get('selfLink', ''), []).append(rule)
+
+        return forwarding_rule_index
+
+    @staticmethod
+    def _get_self_link_index(components) -> dict:
+        '''
+        Position of each component is kept to return matched ones in the order of the list
+        Return value is below
+        {'self link': [(position, component), ...]}
+        '''
+        self_link_index = {}
+        for position, component in enumerate(components):
+            self_link_index.setdefault(component.get('selfLink'), []).append((position, component))
 
-        return matched_forwarding_rules
+        return self_link_index
+
+    @staticmethod
+    def _get_by_self_links(self_link_index, self_links) -> list:
+        matched = [entry for self_link in set(self_links) for entry in self_link_index.get(self_link, [])]
+        return [component for _, component in sorted(matched, key=lambda entry: entry[0])]
 
     @staticmethod
     def _get_external_internal(forwarding_rules) -> str:
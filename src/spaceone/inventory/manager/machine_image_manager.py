@@ -30,8 +30,6 @@ class MachineImageManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         machine_image_id = ""
 
         secret_data = params['secret_data']
@@ -40,14 +38,6 @@ class MachineImageManager(GoogleCloudManager):
 
         # Get machine image
         machine_images = machine_image_conn.list_machine_images()
-        disk_types = []
-        public_images = {}
-
-        if machine_images:
-            public_images = machine_image_conn.list_public_images()
-            for zone in params.get('zones', []):
-                list_disk_types = machine_image_conn.list_disks(zone)
-                disk_types.extend(list_disk_types)
 
         for machine_image in machine_images:
             try:
@@ -91,14 +81,13 @@ class MachineImageManager(GoogleCloudManager):
                     'region_code': region.get('region_code')
                 })
                 self.set_region_code(region.get('region_code'))
-                collected_cloud_services.append(MachineImageResponse({'resource': machine_image_resource}))
+                yield MachineImageResponse({'resource': machine_image_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'MachineImage', machine_image_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Machine Image Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_disks(self, instance, boot_image):
         disk_info = []
@@ -31,8 +31,6 @@ class RouteManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         route_id = ""
 
         secret_data = params['secret_data']
@@ -76,14 +74,13 @@ class RouteManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(region)
-                collected_cloud_services.append(RouteResponse({'resource': route_resource}))
+                yield RouteResponse({'resource': route_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'VPC', 'Route', route_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Route Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_matched_instance(self, route, project_id, instances_over_region):
         all_compute_vms = []
@@ -31,8 +31,6 @@ class SnapshotManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         snapshot_id = ""
 
         secret_data = params['secret_data']
@@ -68,14 +66,13 @@ class SnapshotManager(GoogleCloudManager):
                 })
 
                 self.set_region_code(region.get('region_code'))
-                collected_cloud_services.append(SnapshotResponse({'resource': snapshots_resource}))
+                yield SnapshotResponse({'resource': snapshots_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'Snapshot', snapshot_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** SnapShot Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_matching_region(self, svc_location):
         region_code = svc_location[0] if len(svc_location) > 0 else 'global'
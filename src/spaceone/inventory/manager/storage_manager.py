@@ -1,14 +1,22 @@
 import time
 import logging
+import concurrent.futures
 
 from datetime import datetime, timedelta
 from spaceone.inventory.libs.manager import GoogleCloudManager
 from spaceone.inventory.libs.schema.base import ReferenceModel
 from spaceone.inventory.model.storage.cloud_service import *
-from spaceone.inventory.connector.storage import StorageConnector
+from spaceone.inventory.connector.storage import *
+from spaceone.inventory.connector.monitoring import MonitoringConnector
 from spaceone.inventory.model.storage.cloud_service_type import CLOUD_SERVICE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
+NUMBER_OF_CONCURRENT = 10
+# Of the bucket calls only buckets.list is masked, getIamPolicy returns the full policy resource.
+# projection=full is still needed for acl and defaultObjectAcl, other bucket fields are the ones Storage reads
+BUCKET_FIELDS = 'items(id,name,selfLink,acl,defaultObjectAcl,defaultEventBasedHold,retentionPolicy,iamConfiguration,' \
+                'labels,timeCreated,updated,storageClass,location,locationType,encryption,billing,lifecycle),' \
+                'nextPageToken'
 
 
 class StorageManager(GoogleCloudManager):
@@ -29,71 +37,154 @@ class StorageManager(GoogleCloudManager):
         Response:
             CloudServiceResponse/ErrorResourceResponse
         """
-        collected_cloud_services = []
-        error_responses = []
-        bucket_id = ""
-
         secret_data = params['secret_data']
         project_id = secret_data['project_id']
+        concurrency = params.get('options', {}).get('storage_bucket_concurrency', NUMBER_OF_CONCURRENT)
+        object_listing_options = self._get_object_listing_options(params.get('options', {}))
         storage_conn: StorageConnector = self.locator.get_connector(self.connector_name, **params)
 
         # Get lists that relate with snapshots through Google Cloud API
-        buckets = storage_conn.list_buckets()
-
-        for bucket in buckets:
+        buckets = storage_conn.list_buckets(fields=BUCKET_FIELDS)
+        iam_policies = self._get_iam_policies(storage_conn, buckets)
+        buckets = iter(buckets)
+
+        # Buckets without metrics fall back to object listing
+        bucket_metrics = {}
+        if params.get('options', {}).get('storage_object_stats_source') == 'monitoring':
+            bucket_metrics = self._get_bucket_metrics(params)
+
+        # Buckets are enriched on the worker pool and yielded as each one finishes.
+        # At most `concurrency` buckets are in flight, so a stopped collect does not start the rest.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            future_buckets = {}
             try:
-                bucket_name = bucket.get('name')
-                bucket_id = bucket.get('id')
-
-                objects = storage_conn.list_objects(bucket_name)
-                _LOGGER.debug(f'[collect_cloud_service] objects => {objects}')
-                obj_count, size = self._get_number_of_obj_and_size(objects)
-                iam_policy = storage_conn.list_iam_policy(bucket_name)
-                st_class = bucket.get('storageClass').lower()
-                region = self.get_matching_region(bucket)
-                labels = self.convert_labels_format(bucket.get('labels', {}))
-                stackdriver = self.get_stackdriver(bucket_name)
-                bucket.update({
-                    'project': secret_data['project_id'],
-                    'encryption': self._get_encryption(bucket),
-                    'requester_pays': self._get_requester_pays(bucket),
-                    'retention_policy_display': self._get_retention_policy_display(bucket),
-                    'links': self._get_config_link(bucket),
-                    'size': size,
-                    'stackdriver': stackdriver,
-                    'default_event_based_hold': 'Enabled' if bucket.get('defaultEventBasedHold') else 'Disabled',
-                    'iam_policy': iam_policy,
-                    'iam_policy_binding': self._get_iam_policy_binding(iam_policy),
-                    'object_count': obj_count,
-                    'object_total_size': size,
-                    'lifecycle_rule': self._get_lifecycle_rule(bucket),
-                    'location': self.get_location(bucket),
-                    'default_storage_class': st_class.capitalize(),
-                    'access_control': self._get_access_control(bucket),
-                    'public_access': self._get_public_access(bucket, iam_policy),
-                    'labels': labels
-                })
-                _name = bucket.get('name', '')
-                bucket_data = Storage(bucket, strict=False)
-                # labels -> tags
-                bucket_resource = StorageResource({
-                    'name': _name,
-                    'account': project_id,
-                    'tags': labels,
-                    'region_code': region.get('region_code'),
-                    'data': bucket_data,
-                    'reference': ReferenceModel(bucket_data.reference())
-                })
-
-                self.set_region_code(region.get('region_code'))
-                collected_cloud_services.append(StorageResponse({'resource': bucket_resource}))
-            except Exception as e:
-                _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
-                error_response = self.generate_resource_error_response(e, 'Storage', 'Bucket', bucket_id)
-                error_responses.append(error_response)
+                while True:
+                    for bucket in buckets:
+                        future = executor.submit(self._get_bucket_response, storage_conn, bucket, project_id,
+                                                 object_listing_options, bucket_metrics, iam_policies)
+                        future_buckets[future] = bucket.get('id')
+                        if len(future_buckets) >= concurrency:
+                            break
+
+                    if not future_buckets:
+                        break
+
+                    done, _ = concurrent.futures.wait(future_buckets, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        bucket_id = future_buckets.pop(future)
+                        try:
+                            region_code, storage_response = future.result()
+                            self.set_region_code(region_code)
+                            yield storage_response
+                        except Exception as e:
+                            _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
+                            error_response = self.generate_resource_error_response(e, 'Storage', 'Bucket', bucket_id)
+                            yield error_response
+            finally:
+                for future in future_buckets:
+                    future.cancel()
 
         _LOGGER.debug(f'** Storage Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
+
+    def _get_bucket_response(self, storage_conn, bucket, project_id, object_listing_options, bucket_metrics,
+                             iam_policies):
+        bucket_name = bucket.get('name')
+
+        obj_count, size, is_complete, object_stats_source = \
+            self._get_object_stats(storage_conn, bucket_name, object_listing_options, bucket_metrics)
+        _LOGGER.debug(f'[collect_cloud_service] {bucket_name} => {obj_count} objects, {size} bytes')
+        iam_policy = self.get_batch_response(iam_policies, bucket_name) if bucket_name in iam_policies \
+            else storage_conn.list_iam_policy(bucket_name)
+        st_class = bucket.get('storageClass').lower()
+        region = self.get_matching_region(bucket)
+        labels = self.convert_labels_format(bucket.get('labels', {}))
+        stackdriver = self.get_stackdriver(bucket_name)
+        bucket.update({
+            'project': project_id,
+            'encryption': self._get_encryption(bucket),
+            'requester_pays': self._get_requester_pays(bucket),
+            'retention_policy_display': self._get_retention_policy_display(bucket),
+            'links': self._get_config_link(bucket),
+            'size': size,
+            'stackdriver': stackdriver,
+            'default_event_based_hold': 'Enabled' if bucket.get('defaultEventBasedHold') else 'Disabled',
+            'iam_policy': iam_policy,
+            'iam_policy_binding': self._get_iam_policy_binding(iam_policy),
+            'object_count': obj_count,
+            'object_total_size': size,
+            'object_count_status': 'Complete' if is_complete else 'Partial',
+            'object_stats_source': object_stats_source,
+            'lifecycle_rule': self._get_lifecycle_rule(bucket),
+            'location': self.get_location(bucket),
+            'default_storage_class': st_class.capitalize(),
+            'access_control': self._get_access_control(bucket),
+            'public_access': self._get_public_access(bucket, iam_policy),
+            'labels': labels
+        })
+        _name = bucket.get('name', '')
+        bucket_data = Storage(bucket, strict=False)
+        # labels -> tags
+        bucket_resource = StorageResource({
+            'name': _name,
+            'account': project_id,
+            'tags': labels,
+            'region_code': region.get('region_code'),
+            'data': bucket_data,
+            'reference': ReferenceModel(bucket_data.reference())
+        })
+
+        return region.get('region_code'), StorageResponse({'resource': bucket_resource})
+
+    @staticmethod
+    def _get_iam_policies(storage_conn, buckets):
+        # Buckets missing from a failed batch get their IAM policy one by one
+        try:
+            return storage_conn.batch_list_iam_policy([bucket.get('name') for bucket in buckets])
+        except Exception as e:
+            _LOGGER.error(f'[_get_iam_policies] => {e}', exc_info=True)
+            return {}
+
+    def _get_bucket_metrics(self, params):
+        '''
+        Object count and total size of every bucket in the project from Cloud Monitoring
+        Return value is below
+        {'bucket_name': (object_count, object_total_size)}
+        '''
+        try:
+            monitoring_conn: MonitoringConnector = self.locator.get_connector('MonitoringConnector', **params)
+            object_counts = monitoring_conn.list_bucket_metric('storage/object_count')
+            total_bytes = monitoring_conn.list_bucket_metric('storage/total_bytes')
+        except Exception as e:
+            _LOGGER.error(f'[_get_bucket_metrics] fall back to object listing => {e}', exc_info=True)
+            return {}
+
+        return {bucket_name: (int(object_count), float(total_bytes[bucket_name]))
+                for bucket_name, object_count in object_counts.items() if bucket_name in total_bytes}
+
+    @staticmethod
+    def _get_object_listing_options(options):
+        return {
+            'mode': options.get('storage_object_listing', 'sequential'),
+            'max_objects': options.get('storage_max_objects', MAX_OBJECTS),
+            'time_budget': options.get('storage_list_time_budget', LIST_TIME_BUDGET),
+            'max_api_calls': options.get('storage_list_max_api_calls', LIST_MAX_API_CALLS)
+        }
+
+    @staticmethod
+    def _get_object_stats(storage_conn, bucket_name, object_listing_options, bucket_metrics):
+        '''
+        Buckets without metrics fall back to object listing
+        Return value is (object_count, object_total_size, is_complete, object_stats_source)
+        '''
+        if bucket_name in bucket_metrics:
+            return (*bucket_metrics[bucket_name], True, 'Monitoring')
+
+        if object_listing_options['mode'] == 'sharded':
+            budget = ObjectListBudget(object_listing_options['time_budget'],
+                                      object_listing_options['max_api_calls'])
+            return (*storage_conn.get_object_stats_by_prefix(bucket_name, budget), 'Listing')
+
+        return (*storage_conn.get_object_stats(bucket_name, object_listing_options['max_objects']), 'Listing')
 
     def get_matching_region(self, bucket):
         location_type_ref = ['multi-region', 'dual-region']
@@ -141,17 +232,6 @@ class StorageManager(GoogleCloudManager):
             'location_display': location_display,
         }
 
-    @staticmethod
-    def _get_number_of_obj_and_size(objects):
-        # Overflow (n/a is -1)
-        if objects == False:
-            return -1, -1
-        object_count = len(objects)
-        size = 0.0
-        for obj in objects:
-            size = size + float(obj.get('size'))
-        return object_count, size
-
     @staticmethod
     def _get_encryption(bucket):
         encryption = bucket.get('encryption', {})
@@ -5,7 +5,7 @@ from spaceone.inventory.model.instance.data import Disk
 class DiskManagerResourceHelper(GoogleCloudManager):
     connector_name = 'VMInstanceConnector'
 
-    def get_disk_info(self, instance, disk_list):
+    def get_disk_info(self, instance, disk_index):
         '''
         disk_data = {
             "device_index": 0,
@@ -32,7 +32,7 @@ class DiskManagerResourceHelper(GoogleCloudManager):
         for int_disk in int_disks:
             single_disk_tag = {}
             disk_sz = float(int_disk.get('diskSizeGb'))
-            matching_single_disk_tag = self._get_matched_disk_tag_info(int_disk, disk_list)
+            matching_single_disk_tag = self._get_matched_disk_tag_info(int_disk, disk_index)
             if matching_single_disk_tag is not None:
                 single_disk_type = self._get_disk_type(matching_single_disk_tag)
                 single_disk_tag.update({
@@ -100,13 +100,28 @@ class DiskManagerResourceHelper(GoogleCloudManager):
         return constant
 
     @staticmethod
-    def _get_matched_disk_tag_info(int_disk, disk_list):
-        source_disk = None
+    def get_disk_index(disk_list) -> dict:
+        '''
+        disk_index = {
+            'by_self_link': {'https://www.googleapis.com/compute/v1/projects/xxx/zones/xxx/disks/xxx': disk},
+            'by_name': {'disk_name': disk}
+        }
+        '''
+        by_self_link = {}
+        by_name = {}
+        for disk in disk_list:
+            by_self_link.setdefault(disk.get('selfLink', ''), disk)
+            by_name.setdefault(disk.get('name', ''), disk)
+
+        return {
+            'by_self_link': by_self_link,
+            'by_name': by_name
+        }
+
+    @staticmethod
+    def _get_matched_disk_tag_info(int_disk, disk_index):
         source = int_disk.get('source', '')
-        disk = [disk_single for disk_single in disk_list if disk_single['selfLink'] == source]
-        if len(disk) > 0:
-            source_disk = disk[0]
-        return source_disk
+        return disk_index.get('by_self_link', {}).get(source)
 
     @staticmethod
     def _get_disk_type(matching_single_disk_tag):
@@ -10,29 +10,67 @@ _LOGGER = logging.getLogger(__name__)
 class FirewallManagerResourceHelper(GoogleCloudManager):
     connector_name = 'VMInstanceConnector'
 
-    def list_firewall_rules_info(self, instance, firewall_rules) -> list:
+    def list_firewall_rules_info(self, instance, firewall_index) -> list:
         '''
-
+        firewall_index is built by get_firewall_index()
         '''
 
+        matched_firewall_rules = {}
+        instance_tags = instance.get('tags', {}).get('items', [])
+        instance_service_accounts = [sa.get('email', '') for sa in instance.get('serviceAccounts', [])]
+
+        for network in self._get_instance_network_info(instance):
+            network_firewall_rules = firewall_index.get(network)
+            if network_firewall_rules is None:
+                continue
+
+            # 0. network target tag matching
+            for tag in instance_tags:
+                matched_firewall_rules.update(network_firewall_rules['target_tags'].get(tag, {}))
+            # 1. target service account matching
+            for service_account in instance_service_accounts:
+                matched_firewall_rules.update(network_firewall_rules['target_service_accounts'].get(service_account, {}))
+            # 2. FW rule applies to all instances in subnet
+            matched_firewall_rules.update(network_firewall_rules['all_instances'])
+
         firewall_rules_results = []
-        inst_network_info = self._get_instance_network_info(instance)
-
-        for firewall_rule in firewall_rules:
-            if firewall_rule.get('network') in inst_network_info:
-                # 0. network target tag matching
-                if self._chk_network_tag_is_matched(instance, firewall_rule):
-                    firewall_rules_results.extend(self.list_firewall_rule_data(firewall_rule))
-                # 1. target service account matching
-                elif self._chk_service_account_is_matched(instance, firewall_rule):
-                    firewall_rules_results.extend(self.list_firewall_rule_data(firewall_rule))
-                # 2. FW rule applies to all instances in subnet
-                elif ('targetTags' not in firewall_rule) & ('targetServiceAccounts' not in firewall_rule):
-                    firewall_rules_results.extend(self.list_firewall_rule_data(firewall_rule))
-            else:
-                pass
+        # Keep the order of firewall rules list
+        for idx in sorted(matched_firewall_rules):
+            firewall_rules_results.extend(self.list_firewall_rule_data(matched_firewall_rules[idx]))
+
         return firewall_rules_results
 
+    @staticmethod
+    def get_firewall_index(firewall_rules) -> dict:
+        '''
+        firewall_index = {
+            'network selfLink': {
+                'target_tags': {'tag': {idx: firewall_rule}},
+                'target_service_accounts': {'service account email': {idx: firewall_rule}},
+                'all_instances': {idx: firewall_rule}
+            }
+        }
+        idx is position of the firewall rule in firewall_rules
+        '''
+        firewall_index = {}
+        for idx, firewall_rule in enumerate(firewall_rules):
+            network_firewall_rules = firewall_index.setdefault(firewall_rule.get('network'), {
+                'target_tags': {},
+                'target_service_accounts': {},
+                'all_instances': {}
+            })
+
+            for fw_target_tag in firewall_rule.get('targetTags', []):
+                network_firewall_rules['target_tags'].setdefault(fw_target_tag, {})[idx] = firewall_rule
+
+            for fw_service_account in firewall_rule.get('targetServiceAccounts', []):
+                network_firewall_rules['target_service_accounts'].setdefault(fw_service_account, {})[idx] = firewall_rule
+
+            if ('targetTags' not in firewall_rule) & ('targetServiceAccounts' not in firewall_rule):
+                network_firewall_rules['all_instances'][idx] = firewall_rule
+
+        return firewall_index
+
     def list_firewall_rule_data(self, firewall_rule) -> list:
         security_groups = []
 
@@ -129,26 +167,6 @@ class FirewallManagerResourceHelper(GoogleCloudManager):
         else:
             return 'deny'
 
-    @staticmethod
-    def _chk_network_tag_is_matched(instance, firewall) -> bool:
-        matched = False
-        # compares all fw target tags and instance tags
-        for fw_target_tag in firewall.get('targetTags', []):
-            for tag in instance.get('tags', {}).get('items', []):
-                if tag == fw_target_tag:
-                    matched = True
-        return matched
-
-    @staticmethod
-    def _chk_service_account_is_matched(instance, firewall) -> bool:
-        matched = False
-        # compares all fw target service account and instance service account
-        for instance_service_account in instance.get('serviceAccounts', []):
-            for fw_service_account in firewall.get('targetServiceAccounts', []):
-                if instance_service_account.get('email', '') == fw_service_account:
-                    matched = True
-        return matched
-
     @staticmethod
     def _get_instance_network_info(instance):
         inst_network_interfaces = instance.get('networkInterfaces', [])
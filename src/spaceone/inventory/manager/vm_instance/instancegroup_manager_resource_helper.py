@@ -28,7 +28,11 @@ class InstanceGroupManagerResourceHelper(GoogleCloudManager):
             }
         }
         '''
-        matched_inst_group = self.get_matched_instance_group(instance, instance_group_managers)
+        # instance_group_managers are the managed instance groups of the instance, an instance belongs to one
+        # managed group at most, so the first group with an autoscaler is taken(or the first group if none has)
+        matched_inst_group = next((instance_group for instance_group in instance_group_managers
+                                   if instance_group.get('status', {}).get('autoscaler')),
+                                  instance_group_managers[0] if instance_group_managers else None)
         autoscaler_data = self._get_autoscaler_data(matched_inst_group, autoscalers)
 
         if autoscaler_data is not None:
@@ -36,45 +40,32 @@ class InstanceGroupManagerResourceHelper(GoogleCloudManager):
         else:
             return None
 
-    def get_matched_instance_group(self, instance, instance_groups):
-        matched_instance_group = None
-        for instance_group in instance_groups:
-            find = False
-            instance_list = instance_group.get('instance_list', [])
-            for single_inst in instance_list:
-                instance_name = self._get_key_name('instance', single_inst)
-                if instance.get('name') == instance_name:
-                    matched_instance_group = instance_group
-                    find = True
-                    break
-            if find:
-                break
-
-        return matched_instance_group
-
     '''
     - lists all instances groups
     - list instances for each instance groups
     '''
-    def list_managed_instances_in_instance_groups(self) -> list:
-        instances = []
+    def list_managed_instances_in_instance_groups(self) -> dict:
+        managed_instances = {}
         instancegroup_managers = self.instance_conn.list_instance_group_managers()
-        for instance_group in instancegroup_managers:
-            if 'region' in instance_group:
-                region_name = self.get_region_from_instance_group(instance_group.get('region', ''))
-                tmp_instances = self.instance_conn.list_instance_from_instance_groups(instance_group.get('name', ''),
-                                                                                      'region', region_name)
-                instances.extend(i.get('instance') for i in tmp_instances)
-            else:
-                zone_name = self.get_zone_from_instance_group(instance_group.get('zone', ''))
-                tmp_instances = self.instance_conn.list_instance_from_instance_groups(instance_group.get('name', ''),
-                                                                                      'zone', zone_name)
-                instances.extend(i.get('instance') for i in tmp_instances)
+        instance_group_keys = [self._get_instance_group_key(instance_group) for instance_group in instancegroup_managers]
+        instance_group_members = self.instance_conn.list_instance_group_members(instance_group_keys)
+
+        for instance_group, instance_group_key in zip(instancegroup_managers, instance_group_keys):
+            tmp_instances = self.get_batch_response(instance_group_members, instance_group_key)
+            for tmp_instance in tmp_instances:
+                managed_instances.setdefault(tmp_instance.get('instance'), []).append(instance_group)
         '''
         Return value is below(zone)
-        ['https://www.googleapis.com/compute/v1/projects/{project_id}}/zones/{zone_name{/instances/{instance_name}', 'https://xxx']
+        {'https://www.googleapis.com/compute/v1/projects/{project_id}}/zones/{zone_name{/instances/{instance_name}': [instance_group_manager, ...]}
         '''
-        return instances
+        return managed_instances
+
+    def _get_instance_group_key(self, instance_group):
+        if 'region' in instance_group:
+            return 'region', self.get_region_from_instance_group(instance_group.get('region', '')), \
+                   instance_group.get('name', '')
+
+        return 'zone', self.get_zone_from_instance_group(instance_group.get('zone', '')), instance_group.get('name', '')
 
     '''
     zone expression is => 'zone': 'https://www.googleapis.com/compute/v1/projects/xxxxxx/zones/us-west1-b',
@@ -115,9 +106,3 @@ class InstanceGroupManagerResourceHelper(GoogleCloudManager):
                     }
                     break
         return autoscaler_data
-
-    @staticmethod
-    def _get_key_name(key, self_link_source):
-        instance_self_link = self_link_source.get(key, '')
-        instance_self_link_split = instance_self_link.split('/')
-        return instance_self_link_split[-1]
\ No newline at end of file
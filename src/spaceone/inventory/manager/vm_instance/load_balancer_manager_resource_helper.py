@@ -5,7 +5,8 @@ from spaceone.inventory.model.instance.data import LoadBalancer
 class LoadBalancerManagerResourceHelper(GoogleCloudManager):
     connector_name = 'VMInstanceConnector'
 
-    def get_loadbalancer_info(self, instance, instance_groups, backend_svc, url_maps, target_pools, forwarding_rules):
+    def get_loadbalancer_info(self, instance, instance_groups, backend_svc, url_maps, target_pools, forwarding_rules,
+                              expand_port_range=False):
         '''
         load_balancer_data_list = [{
                 "type": 'HTTP'| 'TCP'| 'UDP'
@@ -15,6 +16,10 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
                 "port": [
                     50051
                 ],
+                "port_ranges": [{
+                    "start": 1,
+                    "end": 65535
+                }],
                 "protocol": [
                     "TCP"
                 ],
@@ -22,10 +27,11 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
             },
             ...
         ]
+        port lists every port of port_ranges only if expand_port_range is set
+        instance_groups and target_pools are the ones which contain the instance
         '''
         load_balancer_data_list = []
-        matched_groups = self.get_matched_instance_group(instance, instance_groups)
-        for matched_group in matched_groups:
+        for matched_group in instance_groups:
             matched_http_backend_svcs = self.get_matched_backend_svc_for_http(matched_group, backend_svc, url_maps)
             matched_lb_infos = matched_http_backend_svcs
             for matched_lb_info in matched_lb_infos:
@@ -43,19 +49,19 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
 
                 load_balancer_data_list.append(LoadBalancer(lb_data, strict=False))
 
-        matched_target_pools = self._get_matched_target_pool(instance, target_pools)
-
-        if len(matched_target_pools) > 0:
-            lbs_by_fd_rules = self._get_matched_forwarding_rules(matched_target_pools, forwarding_rules)
+        if len(target_pools) > 0:
+            lbs_by_fd_rules = self._get_matched_forwarding_rules(target_pools, forwarding_rules)
             for lbs_by_fd_rule in lbs_by_fd_rules:
                 lb_info = lbs_by_fd_rule.get('lb_info', {})
                 protocol = lbs_by_fd_rule.get('IPProtocol', '')
+                port_ranges = self._get_port_ranges(lbs_by_fd_rule)
                 lb_data = {
                     'type': protocol,
                     'name': lb_info.get('name', ''),
                     'dns': '',
                     'scheme': lbs_by_fd_rule.get('loadBalancingScheme', ''),
-                    'port': self._get_port_ranges_into_array(lbs_by_fd_rule),
+                    'port': self._get_ports(port_ranges, expand_port_range),
+                    'port_ranges': port_ranges,
                     'protocol': [protocol] if protocol != '' else [],
                     'tags': {}
                 }
@@ -72,8 +78,8 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
             selected_url_map = self._get_lb_name_from_backend_svc(backend_svc.get('selfLink', ''), url_maps)
             if backend_svc.get('protocol', '') in ['HTTP', 'HTTPS'] and selected_url_map is not None:
                 for backend in backends:
-                    group_name = backend.get('group', '')
-                    if instance_group_key in group_name:
+                    # Exact match, ig-1 must not match ig-10
+                    if self._get_matching_str('group', backend) == instance_group_key:
                         backend_svc.update({
                             'lb_info': selected_url_map
                         })
@@ -82,17 +88,6 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
 
         return matched_backend_svc
 
-    def get_matched_instance_group(self, instance, instance_groups):
-        matched_instance_group = []
-        for instance_group in instance_groups:
-            instance_list = instance_group.get('instance_list', [])
-            for single_inst in instance_list:
-                if instance.get('selfLink', '') == single_inst.get('instance'):
-                    matched_instance_group.append(instance_group)
-                    break
-
-        return matched_instance_group
-
     @staticmethod
     def _get_matching_str(key, matching_item):
         matching_string = matching_item.get(key, '')
@@ -108,15 +103,6 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
                 break
         return selected_url_map
 
-    @staticmethod
-    def _get_matched_target_pool(instance, target_pools):
-        instance_contained_pools = []
-        for target_pool in target_pools:
-            inst_self_link = instance.get('selfLink', '')
-            if any(inst_self_link in s for s in target_pool.get('instances', [])):
-                instance_contained_pools.append(target_pool)
-        return instance_contained_pools
-
     @staticmethod
     def _get_matched_forwarding_rules(target_pools, forwarding_ruls):
         matched_forwarding_rule = []
@@ -132,8 +118,26 @@ class LoadBalancerManagerResourceHelper(GoogleCloudManager):
         return matched_forwarding_rule
 
     @staticmethod
-    def _get_port_ranges_into_array(lbs_by_fd_rule):
-        port_range = lbs_by_fd_rule.get('portRange')
-        ports = port_range.split('-') if port_range.find('-') > 0 else int(port_range)
-        return list(range(int(ports[0]), int(ports[1])+1)) if isinstance(ports, list) and len(ports) == 2 else [ports]
+    def _get_port_ranges(lbs_by_fd_rule):
+        '''
+        portRange: '80' or '1-65535'
+        :return: [{'start': 80, 'end': 80}] or [{'start': 1, 'end': 65535}]
+        '''
+        port_range = lbs_by_fd_rule.get('portRange', '')
+        if port_range == '':
+            return []
+
+        ports = port_range.split('-')
+        return [{'start': int(ports[0]), 'end': int(ports[-1])}]
+
+    @staticmethod
+    def _get_ports(port_ranges, expand_port_range):
+        # Single port is always listed, wide ranges are expanded only on request
+        ports = []
+        for port_range in port_ranges:
+            if port_range['start'] == port_range['end']:
+                ports.append(port_range['start'])
+            elif expand_port_range:
+                ports.extend(range(port_range['start'], port_range['end'] + 1))
+        return ports
 
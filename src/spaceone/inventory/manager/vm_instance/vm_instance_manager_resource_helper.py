@@ -1,10 +1,50 @@
+import re
 import logging
+import threading
+from collections import OrderedDict
 
 from spaceone.inventory.libs.manager import GoogleCloudManager
 from spaceone.inventory.model.instance.data import Compute, GoogleCloud, OS, Hardware
 from spaceone.inventory.connector import VMInstanceConnector
 
 _LOGGER = logging.getLogger(__name__)
+MAX_MACHINE_TYPE_MEMO = 1000
+
+# custom-{cpu}-{memory mb}, {family}-custom-{cpu}-{memory mb}(-ext)
+CUSTOM_MACHINE_TYPE = re.compile(r'^(?:[a-z0-9]+-)?custom-(?P<cpu>\d+|micro|small|medium)-(?P<memory>\d+)(?:-ext)?$')
+# E2 shared core custom machine types expose 2 guest cpus like e2-micro, e2-small and e2-medium
+SHARED_CORE_CPUS = {'micro': 2, 'small': 2, 'medium': 2}
+# temp arch lists will be updated when full list has prepared.
+ARCH_LIST = ['x86_64', 'x86_32', 'x64', 'x86', 'amd64']
+
+
+class MachineTypeMemo(object):
+    """ Machine types fetched by (project_id, zone, machine type), least recently used one is evicted at max_size
+    """
+
+    def __init__(self, max_size=MAX_MACHINE_TYPE_MEMO):
+        self._lock = threading.Lock()
+        self._machine_types = OrderedDict()
+        self.max_size = max_size
+
+    def get(self, key, fetch):
+        with self._lock:
+            if key in self._machine_types:
+                self._machine_types.move_to_end(key)
+                return self._machine_types[key]
+
+        machine_type = fetch()
+
+        with self._lock:
+            self._machine_types[key] = machine_type
+            self._machine_types.move_to_end(key)
+            while len(self._machine_types) > self.max_size:
+                self._machine_types.popitem(last=False)
+
+        return machine_type
+
+
+_machine_type_memo = MachineTypeMemo()
 
 
 class VMInstanceManagerResourceHelper(GoogleCloudManager):
@@ -14,7 +54,7 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
     def __init__(self, gcp_connector=None):
         self.instance_conn: VMInstanceConnector = gcp_connector
 
-    def get_server_info(self, instance, instance_types, disks, zone_info, public_images, instance_in_managed_instance_groups):
+    def get_server_info(self, instance, instance_type_index, disk_index, zone_info, image_os_index, instance_groups):
         '''
         server_data = {
             "name": '',
@@ -73,11 +113,11 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
         }
         '''
 
-        os_type, os_data = self.get_os_type_and_data(instance, public_images)
+        os_type, os_data = self.get_os_type_and_data(instance, image_os_index)
         server_dic = self.get_server_dic(instance, os_type, zone_info)
-        google_cloud_data = self.get_google_cloud_data(instance, instance_in_managed_instance_groups)
-        hardware_data = self.get_hardware_data(instance, instance_types, zone_info)
-        compute_data = self.get_compute_data(instance, disks, zone_info)
+        google_cloud_data = self.get_google_cloud_data(instance, instance_groups)
+        hardware_data = self.get_hardware_data(instance, instance_type_index, zone_info)
+        compute_data = self.get_compute_data(instance, disk_index, zone_info)
 
         server_dic.update({
             'data': {
@@ -103,7 +143,7 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
 
         return server_data
 
-    def get_os_type_and_data(self, instance, public_images):
+    def get_os_type_and_data(self, instance, image_os_index):
 
         disk_info = instance.get("disks", [])
         os_dists = disk_info[0].get('licenses', []) if len(disk_info) > 0 else []
@@ -119,36 +159,48 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
                     os_type = "WINDOWS"
                 break
 
-        os_data = self._get_appropriate_image_info(os_identity, licenses, public_images)
+        os_data = self._get_appropriate_image_info(os_identity, licenses, image_os_index)
         return os_type, OS(os_data, strict=False)
 
     @staticmethod
-    def _get_appropriate_image_info(os_identity, licenses, public_images):
-        # temp arch lists will be updated when full list has prepared.
-        arch_list = ['x86_64', 'x86_32', 'x64', 'x86', 'amd64']
-        os_data = {
+    def _get_appropriate_image_info(os_identity, licenses, image_os_index):
+        by_license = image_os_index.get('by_license', {})
+        for key in image_os_index.get('keys', []):
+            if key in os_identity and (key, tuple(licenses)) in by_license:
+                return dict(by_license[(key, tuple(licenses))])
+
+        return {
             'details': '',
             'os_distro': '',
             'os_arch': ''
         }
-        for key, images in public_images.items():
-            find = False
-            if key in os_identity:
-                for image in images:
-                    if licenses == image.get('licenses', []):
-                        os_arch_index = [i for i, e in enumerate(arch_list) if e in image.get('description', '')]
-
-                        os_data.update({'os_distro': 'windows-server' if key == 'windows' else key,
-                                        'details': image.get('description', ''),
-                                        'os_arch': arch_list[os_arch_index[0]] if len(os_arch_index) > 0 else ''})
-                        find = True
-                        break
-            if find:
-                break
 
-        return os_data
+    @staticmethod
+    def get_image_os_index(public_images) -> dict:
+        '''
+        OS data of the newest image of each license list in every image project
+        image_os_index = {
+            'keys': ['image project key', ...],
+            'by_license': {('image project key', (license, ...)): os_data}
+        }
+        '''
+        by_license = {}
+        for key, images in public_images.items():
+            for image in images:
+                description = image.get('description', '')
+                os_arch = next((arch for arch in ARCH_LIST if arch in description), '')
+                by_license.setdefault((key, tuple(image.get('licenses', []))), {
+                    'os_distro': 'windows-server' if key == 'windows' else key,
+                    'details': description,
+                    'os_arch': os_arch
+                })
+
+        return {
+            'keys': list(public_images),
+            'by_license': by_license
+        }
 
-    def get_google_cloud_data(self, instance, instance_in_managed_instance_groups):
+    def get_google_cloud_data(self, instance, instance_groups):
         google_cloud = {
             "self_link": instance.get('selfLink', ''),
             "fingerprint": instance.get('fingerprint', ''),
@@ -156,12 +208,12 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
             "deletion_protection": instance.get('deletionProtection', False),
             "scheduling": self.get_scheduling(instance),
             "labels": instance.get('labels', {}),
-            'is_managed_instance': True if instance.get('selfLink', '') in instance_in_managed_instance_groups else False,
+            'is_managed_instance': len(instance_groups) > 0,
         }
 
         return GoogleCloud(google_cloud, strict=False)
 
-    def get_hardware_data(self, instance, instance_types, zone_info):
+    def get_hardware_data(self, instance, instance_type_index, zone_info):
         '''
         core = IntType(default=0)
         memory = FloatType(default=0.0)
@@ -169,10 +221,10 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
         cpu_model = ListType(StringType(default=""))
         '''
 
-        core, memory = self._get_core_and_memory(instance, instance_types)
+        core, memory = self._get_core_and_memory(instance, instance_type_index)
 
         if core == 0 and memory == 0:
-            core, memory = self.get_custom_image_type(instance, zone_info, instance_types)
+            core, memory = self.get_custom_image_type(instance, zone_info)
 
         hardware_data = {
             'core': core,
@@ -183,7 +235,7 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
 
         return Hardware(hardware_data, strict=False)
 
-    def get_compute_data(self, instance, disks, zone_info):
+    def get_compute_data(self, instance, disk_index, zone_info):
         '''
             {
                 'keypair': StringType(default="")
@@ -209,24 +261,44 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
             'instance_state': instance.get('status'),
             'instance_type': self._get_instance_type(instance),
             'account': zone_info.get('project_id', ''),
-            'image': self._get_images(instance, disks),
+            'image': self._get_images(instance, disk_index),
             'launched_at': instance.get('creationTimestamp'),
             'tags': self._get_tags_only_string_values(instance)
         }
 
         return Compute(compute_data)
 
-    def get_custom_image_type(self, instance, zone_info, instance_types):
+    def get_custom_image_type(self, instance, zone_info):
         machine = instance.get('machineType', '')
         _machine = machine[machine.rfind('/')+1:]
+        _zone = zone_info.get('zone')
+
+        if custom_machine_type := self.decode_custom_machine_type(_machine):
+            return custom_machine_type
 
-        custom_image_type = self.instance_conn.get_machine_type(zone_info.get('zone'), _machine)
-        instance_types.append(custom_image_type)
+        # Machine types available to each project can differ, the memo is shared by every tenant in the process
+        custom_image_type = _machine_type_memo.get((zone_info.get('project_id'), _zone, _machine),
+                                                   lambda: self.instance_conn.get_machine_type(_zone, _machine))
 
         cpu = custom_image_type.get('guestCpus', 0)
         memory = round(float((custom_image_type.get('memoryMb', 0)) / 1024), 2)
         return cpu, memory
 
+    @staticmethod
+    def decode_custom_machine_type(machine_type):
+        '''
+        custom-4-5120 => (4, 5.0), e2-custom-micro-2048 => (2, 2.0)
+        Returns None if machine_type is not a custom machine type
+        '''
+        matched = CUSTOM_MACHINE_TYPE.match(machine_type)
+        if matched is None:
+            return None
+
+        _cpu = matched.group('cpu')
+        cpu = SHARED_CORE_CPUS[_cpu] if _cpu in SHARED_CORE_CPUS else int(_cpu)
+        memory = round(float(int(matched.group('memory')) / 1024), 2)
+        return cpu, memory
+
     @staticmethod
     def _get_tags_only_string_values(instance):
         tags = {}
@@ -236,15 +308,13 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
         return tags
 
     @staticmethod
-    def _get_images(instance, disks):
+    def _get_images(instance, disk_index):
         image = ''
         name = instance.get('name', '')
 
-        for disk in disks:
-            if name == disk.get('name', ''):
-                _image = disk.get('sourceImage', '')
-                image = _image[_image.rfind('/')+1:]
-                break
+        if disk := disk_index.get('by_name', {}).get(name):
+            _image = disk.get('sourceImage', '')
+            image = _image[_image.rfind('/')+1:]
         return image
 
     @staticmethod
@@ -254,16 +324,57 @@ class VMInstanceManagerResourceHelper(GoogleCloudManager):
         return machine_split[-1]
 
     @staticmethod
-    def _get_core_and_memory(instance, instance_types):
+    def get_membership_index(managed_instances, target_pools) -> dict:
+        '''
+        managed_instances = {'instance self link': [instance_group_manager, ...]}
+        Return value is below
+        membership_index = {
+            'instance self link': {'groups': [instance_group_manager, ...], 'pools': [target_pool, ...]}
+        }
+        '''
+        membership_index = {}
+        for self_link, instance_groups in managed_instances.items():
+            membership_index.setdefault(self_link, {'groups': [], 'pools': []})['groups'].extend(instance_groups)
+
+        for target_pool in target_pools:
+            for self_link in set(target_pool.get('instances', [])):
+                membership_index.setdefault(self_link, {'groups': [], 'pools': []})['pools'].append(target_pool)
+
+        return membership_index
+
+    @staticmethod
+    def get_instance_type_index(instance_types) -> dict:
+        '''
+        instance_type_index = {
+            'by_zone': {('zone', 'machine type name'): machine_type},
+            'by_name': {'machine type name': machine_type}
+        }
+        '''
+        by_zone = {}
+        by_name = {}
+        for i_type in instance_types:
+            zone = i_type.get('zone', '')
+            _name = i_type.get('name', '')
+            by_zone.setdefault((zone[zone.rfind('/') + 1:], _name), i_type)
+            by_name.setdefault(_name, i_type)
+
+        return {
+            'by_zone': by_zone,
+            'by_name': by_name
+        }
+
+    @staticmethod
+    def _get_core_and_memory(instance, instance_type_index):
         machine_type = instance.get('machineType', '')
         _machine = machine_type[machine_type.rfind('/') + 1:]
+        _zone = GoogleCloudManager.get_param_in_url(machine_type, 'zones')
         cpu = 0
         memory = 0
-        for i_type in instance_types:
-            if i_type.get('selfLink', '') == machine_type or i_type.get('name', '') == _machine:
-                cpu = i_type.get('guestCpus')
-                memory = round(float((i_type.get('memoryMb', 0)) / 1024), 2)
-                break
+
+        i_type = instance_type_index['by_zone'].get((_zone, _machine)) or instance_type_index['by_name'].get(_machine)
+        if i_type is not None:
+            cpu = i_type.get('guestCpus')
+            memory = round(float((i_type.get('memoryMb', 0)) / 1024), 2)
 
         return cpu, memory
 
@@ -10,7 +10,7 @@ class VPCManagerResourceHelper(GoogleCloudManager):
 
     connector_name = 'VMInstanceConnector'
 
-    def get_vpc_info(self, instance, vpcs, subnets):
+    def get_vpc_info(self, instance, vpc_index):
         """
         vpc_data = {
             "vpc_id": "",
@@ -33,8 +33,9 @@ class VPCManagerResourceHelper(GoogleCloudManager):
         subnet_data = {}
 
         # To get vpc, subnet related to instance
-        matched_subnet = self._get_matching_subnet(instance, subnets)
-        matched_vpc = self._get_matching_vpc(matched_subnet, vpcs)
+        matched_subnet = self._get_matching_subnet(instance, vpc_index.get('subnet_by_self_link', {}),
+                                                   vpc_index.get('subnet_position', {}))
+        matched_vpc = self._get_matching_vpc(matched_subnet, vpc_index.get('vpc_by_subnet', {}))
 
         vpc_data.update({
             'vpc_id': matched_vpc.get('id', ''),
@@ -55,23 +56,44 @@ class VPCManagerResourceHelper(GoogleCloudManager):
         return VPC(vpc_data, strict=False), Subnet(subnet_data, strict=False)
 
     @staticmethod
-    def _get_matching_vpc(matched_subnet, vpcs) -> dict:
-        matching_vpc = {}
+    def get_vpc_index(vpcs, subnets) -> dict:
+        '''
+        vpc_index = {
+            'subnet_by_self_link': {'subnet selfLink': subnet},
+            'subnet_position': {'subnet selfLink': position in subnets},
+            'vpc_by_subnet': {'subnet selfLink': vpc}
+        }
+        '''
+        subnet_by_self_link = {}
+        subnet_position = {}
+        vpc_by_subnet = {}
+
+        for position, subnet in enumerate(subnets):
+            subnet_by_self_link.setdefault(subnet.get('selfLink', ''), subnet)
+            subnet_position.setdefault(subnet.get('selfLink', ''), position)
+
+        for vpc in vpcs:
+            for subnetwork in vpc.get('subnetworks', []):
+                vpc_by_subnet.setdefault(subnetwork, vpc)
+
+        return {
+            'subnet_by_self_link': subnet_by_self_link,
+            'subnet_position': subnet_position,
+            'vpc_by_subnet': vpc_by_subnet
+        }
+
+    @staticmethod
+    def _get_matching_vpc(matched_subnet, vpc_by_subnet) -> dict:
         network = matched_subnet.get('selfLink', None)
-        # Instance cannot be placed in multiple VPCs(Break after first matched result)
+        # Instance cannot be placed in multiple VPCs(first matched result)
         if network is not None:
-            for vpc in vpcs:
-                if network in vpc.get('subnetworks', []):
-                    matching_vpc = vpc
-                    break
+            return vpc_by_subnet.get(network, {})
 
-        return matching_vpc
+        return {}
 
     @staticmethod
-    def _get_matching_subnet(instance, subnets) -> dict:
-        subnet_data = {}
+    def _get_matching_subnet(instance, subnet_by_self_link, subnet_position) -> dict:
         subnetwork_links = []
-
         network_interfaces = instance.get('networkInterfaces', [])
         for network_interface in network_interfaces:
             """ 
@@ -80,15 +102,15 @@ class VPCManagerResourceHelper(GoogleCloudManager):
             - legacy : reference selfLink is not supported
             """
             subnetwork = network_interface.get('subnetwork', '')
-            if subnetwork != '':
+            if subnetwork != '' and subnetwork in subnet_by_self_link:
                 subnetwork_links.append(subnetwork)
+
         # Need to enhanced(multiple networkInterface in multiple subnets)
-        for subnet in subnets:
-            if subnet.get('selfLink', '') in subnetwork_links:
-                subnet_data = subnet
-                break
+        # The first match in the order of the subnet list, not of the network interfaces
+        if not subnetwork_links:
+            return {}
 
-        return subnet_data
+        return subnet_by_self_link[min(subnetwork_links, key=lambda link: subnet_position.get(link, 0))]
 
     @staticmethod
     def _get_network_str(subnet):
@@ -1,8 +1,10 @@
 import time
 import logging
+import concurrent.futures
 
 from spaceone.inventory.libs.manager import GoogleCloudManager
 from spaceone.inventory.connector import VMInstanceConnector
+from spaceone.inventory.connector.vm_instance import NUMBER_OF_ZONE_SHARDS
 from spaceone.inventory.manager.vm_instance.vm_instance_manager_resource_helper import VMInstanceManagerResourceHelper
 from spaceone.inventory.manager.vm_instance.instancegroup_manager_resource_helper import InstanceGroupManagerResourceHelper
 from spaceone.inventory.manager.vm_instance.disk_manager_resource_helper import DiskManagerResourceHelper
@@ -20,13 +22,17 @@ from spaceone.inventory.libs.schema.cloud_service import VMInstanceResourceRespo
 _LOGGER = logging.getLogger(__name__)
 NUMBER_OF_CONCURRENT = 20
 
+# Partial response masks, only the fields consumed by the resource helpers
+MACHINE_TYPE_FIELDS = 'items/*/machineTypes(name,zone,guestCpus,memoryMb),nextPageToken'
+PUBLIC_IMAGE_FIELDS = 'items(licenses,description)'
+
 
 class VMInstanceManager(GoogleCloudManager):
     connector_name = 'VMInstanceConnector'
     cloud_service_types = CLOUD_SERVICE_TYPES
     instance_conn = None
 
-    def collect_cloud_service(self, params) -> ([VMInstanceResourceResponse], []):
+    def collect_cloud_service(self, params):
         '''
         params = {
             'zone_info': {
@@ -37,8 +43,6 @@ class VMInstanceManager(GoogleCloudManager):
             'secret_data': 'secret_data'
         }
         '''
-        resource_responses = []
-        error_responses = []
         vm_id = ""
 
         start_time = time.time()
@@ -46,25 +50,26 @@ class VMInstanceManager(GoogleCloudManager):
         project_id = secret_data.get('project_id', '')
 
         self.instance_conn: VMInstanceConnector = self.locator.get_connector(self.connector_name, **params)
+        expand_port_range = params.get('options', {}).get('expand_port_range', False)
         all_resources = self.get_all_resources(project_id)
-        compute_vms = self.instance_conn.list_instances()
+        compute_vms = self._iter_instances(params.get('options', {}))
 
         for compute_vm in compute_vms:
             try:
                 vm_id = compute_vm.get('id')
                 zone, region = self._get_zone_and_region(compute_vm)
                 zone_info = {'zone': zone, 'region': region, 'project_id': project_id}
-                resource = self.get_vm_instance_resource(project_id, zone_info, compute_vm, all_resources)
+                resource = self.get_vm_instance_resource(project_id, zone_info, compute_vm, all_resources,
+                                                         expand_port_range)
 
-                resource_responses.append(VMInstanceResourceResponse({'resource': resource}))
                 self.set_region_code(resource.get('region_code', ''))
+                yield VMInstanceResourceResponse({'resource': resource})
             except Exception as e:
                 _LOGGER.error(f'[list_resources] vm_id => {vm_id}, error => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'ComputeEngine', 'Instance', vm_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** Compute VMs Finished {time.time() - start_time} Seconds **')
-        return resource_responses, error_responses
 
     # To get all related resources from all regions
     def get_all_resources(self, project_id) -> dict:
@@ -72,54 +77,97 @@ class VMInstanceManager(GoogleCloudManager):
         instancegroup_manager_helper: InstanceGroupManagerResourceHelper = InstanceGroupManagerResourceHelper(
             self.instance_conn)
 
-        return {
-            'disk': self.instance_conn.list_disks(),
-            'autoscaler': self.instance_conn.list_autoscalers(),
-            'instance_type': self.instance_conn.list_machine_types(),
-            'instance_group': self.instance_conn.list_instance_group_managers(),
-            'public_images': self.instance_conn.list_images(project_id),
-            'vpcs': self.instance_conn.list_vpcs(),
-            'subnets': self.instance_conn.list_subnetworks(),
-            'firewalls': self.instance_conn.list_firewall(),
-            'forwarding_rules': self.instance_conn.list_forwarding_rules(),
-            'target_pools': self.instance_conn.list_target_pools(),
-            'url_maps': self.instance_conn.list_url_maps(),
-            'backend_svcs': self.instance_conn.list_back_end_services(),
-            'managed_instances_in_instance_groups': instancegroup_manager_helper.list_managed_instances_in_instance_groups()
+        # Independent list calls, each one paginates fully on its own thread
+        list_calls = {
+            'disk': self.instance_conn.list_disks,
+            'autoscaler': self.instance_conn.list_autoscalers,
+            'instance_type': lambda: self.instance_conn.list_machine_types(fields=MACHINE_TYPE_FIELDS),
+            'public_images': lambda: self.instance_conn.list_images(project_id, fields=PUBLIC_IMAGE_FIELDS),
+            'vpcs': self.instance_conn.list_vpcs,
+            'subnets': self.instance_conn.list_subnetworks,
+            'firewalls': self.instance_conn.list_firewall,
+            'forwarding_rules': self.instance_conn.list_forwarding_rules,
+            'target_pools': self.instance_conn.list_target_pools,
+            'url_maps': self.instance_conn.list_url_maps,
+            'backend_svcs': self.instance_conn.list_back_end_services,
+            'managed_instances_in_instance_groups': instancegroup_manager_helper.list_managed_instances_in_instance_groups
         }
 
-    def get_vm_instance_resource(self, project_id, zone_info, instance, all_resources) -> VMInstanceResource:
+        start_time = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=NUMBER_OF_CONCURRENT) as executor:
+            future_resources = {key: executor.submit(self._timed_list_call, key, list_call)
+                                for key, list_call in list_calls.items()}
+            all_resources = {key: future.result() for key, future in future_resources.items()}
+
+        _LOGGER.debug(f'[get_all_resources] all list calls finished in {time.time() - start_time:.2f} seconds')
+
+        # Lookup indexes to match related resources of each VM
+        all_resources.update({
+            'disk_index': DiskManagerResourceHelper.get_disk_index(all_resources['disk']),
+            'instance_type_index': VMInstanceManagerResourceHelper.get_instance_type_index(all_resources['instance_type']),
+            'image_os_index': VMInstanceManagerResourceHelper.get_image_os_index(all_resources['public_images']),
+            'membership_index': VMInstanceManagerResourceHelper.get_membership_index(
+                all_resources['managed_instances_in_instance_groups'], all_resources['target_pools']),
+            'vpc_index': VPCManagerResourceHelper.get_vpc_index(all_resources['vpcs'], all_resources['subnets']),
+            'firewall_index': FirewallManagerResourceHelper.get_firewall_index(all_resources['firewalls'])
+        })
+
+        return all_resources
+
+    def _iter_instances(self, options):
+        # Large projects list each zone concurrently instead of paginating a single aggregatedList
+        if options.get('vm_instance_listing') == 'zone_sharded':
+            zones = [zone.get('name') for zone in self.instance_conn.list_zones()]
+            max_workers = options.get('vm_instance_listing_concurrency', NUMBER_OF_ZONE_SHARDS)
+            return self.instance_conn.iter_instances_by_zone(zones, max_workers)
+
+        # The unfiltered instances.aggregatedList is shared with Route, Firewall, VPC and External IP
+        # through the collect cache, and filtered by status in list_instances.
+        # Without the collect cache, VMs are transformed page by page while the next page is fetched.
+        if self.instance_conn.collect_cache is not None:
+            return self.instance_conn.list_instances()
+
+        return self.instance_conn.iter_instances()
+
+    @staticmethod
+    def _timed_list_call(key, list_call):
+        start_time = time.time()
+        result = list_call()
+        _LOGGER.debug(f'[get_all_resources] {key} => {len(result)} items, {time.time() - start_time:.2f} seconds')
+        return result
+
+    def get_vm_instance_resource(self, project_id, zone_info, instance, all_resources,
+                                 expand_port_range=False) -> VMInstanceResource:
         ''' Prepare input params for call maanger '''
         # VPC
-        vpcs = all_resources.get('vpcs', [])
-        subnets = all_resources.get('subnets', [])
+        vpc_index = all_resources.get('vpc_index', {})
 
-        # All Public Images
-        public_images = all_resources.get('public_images', {})
+        # OS data of public images by license
+        image_os_index = all_resources.get('image_os_index', {})
 
         # URL Maps
         url_maps = all_resources.get('url_maps', [])
         backend_svcs = all_resources.get('backend_svcs', [])
-        target_pools = all_resources.get('target_pools', [])
 
         # Forwarding Rules
         forwarding_rules = all_resources.get('forwarding_rules', [])
 
         # Firewall
-        firewalls = all_resources.get('firewalls', [])
+        firewall_index = all_resources.get('firewall_index', {})
 
-        # Get Instance Groups
-        instance_group = all_resources.get('instance_group', [])
+        # Managed instance groups and target pools of the instance
+        membership = all_resources.get('membership_index', {}).get(instance.get('selfLink', ''), {})
+        instance_groups = membership.get('groups', [])
+        target_pools = membership.get('pools', [])
 
         # Get Machine Types
-        instance_types = all_resources.get('instance_type', [])
+        instance_type_index = all_resources.get('instance_type_index', {})
 
         # Autoscaling group list
         autoscaler = all_resources.get('autoscaler', [])
-        instance_in_managed_instance_groups = all_resources.get('managed_instances_in_instance_groups', [])
 
         # disks
-        disks = all_resources.get('disk', [])
+        disk_index = all_resources.get('disk_index', {})
 
         '''Get related resources from managers'''
         vm_instance_manager_helper: VMInstanceManagerResourceHelper = VMInstanceManagerResourceHelper(
@@ -133,18 +181,19 @@ class VMInstanceManager(GoogleCloudManager):
         firewall_manager_helper: FirewallManagerResourceHelper = FirewallManagerResourceHelper()
         stackdriver_manager_helper: StackDriverManagerResourceHelper = StackDriverManagerResourceHelper()
 
-        autoscaler_vo = auto_scaler_manager_helper.get_autoscaler_info(instance, instance_group, autoscaler)
-        load_balancer_vos = loadbalancer_manager_helper.get_loadbalancer_info(instance, instance_group, backend_svcs,
+        autoscaler_vo = auto_scaler_manager_helper.get_autoscaler_info(instance, instance_groups, autoscaler)
+        load_balancer_vos = loadbalancer_manager_helper.get_loadbalancer_info(instance, instance_groups, backend_svcs,
                                                                               url_maps,
-                                                                              target_pools, forwarding_rules)
-        disk_vos = disk_manager_helper.get_disk_info(instance, disks)
-        vpc_vo, subnet_vo = vpc_manager_helper.get_vpc_info(instance, vpcs, subnets)
+                                                                              target_pools, forwarding_rules,
+                                                                              expand_port_range)
+        disk_vos = disk_manager_helper.get_disk_info(instance, disk_index)
+        vpc_vo, subnet_vo = vpc_manager_helper.get_vpc_info(instance, vpc_index)
         nic_vos = nic_manager_helper.get_nic_info(instance, subnet_vo)
-        firewall_vos = firewall_manager_helper.list_firewall_rules_info(instance, firewalls)
+        firewall_vos = firewall_manager_helper.list_firewall_rules_info(instance, firewall_index)
 
         firewall_names = [d.get('name') for d in firewall_vos if d.get('name', '') != '']
-        server_data = vm_instance_manager_helper.get_server_info(instance, instance_types, disks, zone_info,
-                                                                 public_images, instance_in_managed_instance_groups)
+        server_data = vm_instance_manager_helper.get_server_info(instance, instance_type_index, disk_index, zone_info,
+                                                                 image_os_index, instance_groups)
         google_cloud = server_data['data'].get('google_cloud', {})
         _google_cloud = google_cloud.to_primitive()
         labels = _google_cloud.get('labels', [])
@@ -30,8 +30,6 @@ class VPCNetworkManager(GoogleCloudManager):
             CloudServiceResponse/ErrorResourceResponse
         """
 
-        collected_cloud_services = []
-        error_responses = []
         network_id = ""
 
         secret_data = params['secret_data']
@@ -89,14 +87,13 @@ class VPCNetworkManager(GoogleCloudManager):
                 })
 
                 self.set_region_code('global')
-                collected_cloud_services.append(VPCNetworkResponse({'resource': vpc_resource}))
+                yield VPCNetworkResponse({'resource': vpc_resource})
             except Exception as e:
                 _LOGGER.error(f'[collect_cloud_service] => {e}', exc_info=True)
                 error_response = self.generate_resource_error_response(e, 'VPC', 'VPCNetwork', network_id)
-                error_responses.append(error_response)
+                yield error_response
 
         _LOGGER.debug(f'** VPC Network Finished {time.time() - start_time} Seconds **')
-        return collected_cloud_services, error_responses
 
     def get_internal_ip_address_in_use(self, network, regional_address):
         all_internal_addresses = []
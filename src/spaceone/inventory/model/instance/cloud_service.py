@@ -106,6 +106,8 @@ lb = TableDynamicLayout.set_fields('LB', root_path='data.load_balancers', fields
     }),
     ListDyField.data_source('Protocol', 'protocol', options={'delimiter': '<br>'}),
     ListDyField.data_source('Port', 'port', options={'delimiter': '<br>'}),
+    ListDyField.data_source('Port Range Start', 'port_ranges', options={'sub_key': 'start', 'delimiter': '<br>'}),
+    ListDyField.data_source('Port Range End', 'port_ranges', options={'sub_key': 'end', 'delimiter': '<br>'}),
     EnumDyField.data_source('Scheme', 'scheme', default_badge={
         'indigo.500': ['EXTERNAL'], 'coral.600': ['INTERNAL']
     }),
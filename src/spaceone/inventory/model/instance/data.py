@@ -92,11 +92,17 @@ class Disk(Model):
 
 
 # loadbalancing = load_balancer
+class PortRange(Model):
+    start = IntType()
+    end = IntType()
+
+
 class LoadBalancer(Model):
     type = StringType(choices=('HTTP', 'TCP', 'UDP'))
     name = StringType()
     dns = StringType(default="")
     port = ListType(IntType())
+    port_ranges = ListType(ModelType(PortRange), serialize_when_none=False)
     protocol = ListType(StringType())
     scheme = StringType(choices=('EXTERNAL', 'INTERNAL'))
     tags = DictType(StringType, default={})
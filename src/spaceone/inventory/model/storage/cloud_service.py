@@ -19,6 +19,10 @@ bucket_configuration_meta = ItemDynamicLayout.set_fields('Configurations', field
     TextDyField.data_source('Encryption Type', 'data.encryption'),
     TextDyField.data_source('Object Total Counts', 'data.object_count'),
     SizeField.data_source('Object Size', 'data.object_total_size'),
+    EnumDyField.data_source('Object Count Status', 'data.object_count_status', default_badge={
+        'indigo.500': ['Complete'], 'coral.600': ['Partial']
+    }),
+    TextDyField.data_source('Object Stats Source', 'data.object_stats_source'),
     EnumDyField.data_source('Public Access', 'data.public_access', default_state={
             'safe': ['Subject to object ACLs', 'Not public'],
             'warning': ['Not authorized'],
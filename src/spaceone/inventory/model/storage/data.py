@@ -151,6 +151,8 @@ class Storage(Model):
     requester_pays = StringType(choices=('ON', 'OFF'))
     object_count = IntType(default=0)
     object_total_size = FloatType(default=0.0)
+    object_count_status = StringType(choices=('Complete', 'Partial'))
+    object_stats_source = StringType(choices=('Listing', 'Monitoring'))
     size = FloatType(default=0.0)
     labels = ListType(ModelType(Labels), default=[])
     encryption = StringType(choices=('Google-managed', 'Customer-managed'))
@@ -1,15 +1,20 @@
 import time
+import queue
 import logging
 import json
+import threading
 import concurrent.futures
 
 from spaceone.inventory.libs.connector import GoogleCloudConnector
 from spaceone.inventory.libs.manager import GoogleCloudManager
+from spaceone.inventory.libs.collect_cache import CollectCache
+from spaceone.inventory.libs.catalog_cache import get_catalog_cache, DEFAULT_CATALOG_CACHE_PATH
 from spaceone.core.service import *
 from spaceone.inventory.libs.schema.cloud_service import ErrorResourceResponse
 from spaceone.inventory.conf.cloud_service_conf import *
 
 _LOGGER = logging.getLogger(__name__)
+_COLLECT_DONE = object()
 
 
 @authentication_handler
@@ -90,25 +95,106 @@ class CollectorService(BaseService):
             error_resource_response = self.generate_error_response(e, '', 'inventory.Error')
             yield error_resource_response.to_primitive()
 
+        # Raw lists fetched by several managers are shared during this collect
+        collect_cache = CollectCache()
+        # Machine types, public images, regions and zones are kept on disk across collects
+        catalog_cache = self._get_catalog_cache(params.get('options', {}))
+        params.update({'collect_cache': collect_cache, 'catalog_cache': catalog_cache})
+
         # Execute manager
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKER) as executor:
-            future_executors = []
-            for execute_manager in self.execute_managers:
+        # Each manager streams its responses into a bounded queue, so resources are yielded as soon as they are built
+        result_queue = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+        stop_event = threading.Event()
 
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKER)
+        future_managers = {}
+        try:
+            for execute_manager in self.execute_managers:
                 _manager = self.locator.get_manager(execute_manager)
-                future_executors.append(executor.submit(_manager.collect_resources, params))
+                future = executor.submit(self._collect_manager_resources, _manager, params, result_queue, stop_event)
+                future_managers[future] = execute_manager
 
-            for future in concurrent.futures.as_completed(future_executors):
+            remaining_managers = len(future_managers)
+            while remaining_managers > 0:
                 try:
-                    for result in future.result():
-                        yield result.to_primitive()
-                except Exception as e:
-                    _LOGGER.error(f'[collect] failed to yield result => {e}', exc_info=True)
-                    error_resource_response = self.generate_error_response(e, '', 'inventory.Error')
-                    yield error_resource_response.to_primitive()
-
+                    result = result_queue.get(timeout=RESULT_QUEUE_TIMEOUT)
+                except queue.Empty:
+                    # Workers which died without posting _COLLECT_DONE would block the collect forever
+                    if all(future.done() for future in future_managers):
+                        break
+                    continue
+
+                if result is _COLLECT_DONE:
+                    remaining_managers -= 1
+                else:
+                    yield result
+
+            concurrent.futures.wait(future_managers)
+            yield from self._drain_results(result_queue, future_managers)
+        finally:
+            # When the stream is closed early, workers blocked on a full queue are released,
+            # managers not started yet are cancelled and in-flight API calls are not waited for
+            stop_event.set()
+            for future in future_managers:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        _LOGGER.debug(f'[collect] collect cache hits => {collect_cache.hits}, misses => {collect_cache.misses}')
         _LOGGER.debug(f'TOTAL TIME : {time.time() - start_time} Seconds')
 
+    @staticmethod
+    def _get_catalog_cache(options):
+        if not options.get('catalog_cache', False):
+            return None
+
+        try:
+            return get_catalog_cache(options.get('catalog_cache_path', DEFAULT_CATALOG_CACHE_PATH))
+        except Exception as e:
+            _LOGGER.error(f'[_get_catalog_cache] collect without catalog cache => {e}', exc_info=True)
+            return None
+
+    def _drain_results(self, result_queue, future_managers):
+        # Every worker has finished, results left in the queue are yielded and managers which raised are reported
+        while True:
+            try:
+                result = result_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if result is not _COLLECT_DONE:
+                yield result
+
+        for future, execute_manager in future_managers.items():
+            if not future.cancelled() and (e := future.exception()) is not None:
+                _LOGGER.error(f'[collect] {execute_manager} stopped without finishing => {e!r}')
+                error_resource_response = self.generate_error_response(e, '', 'inventory.Error')
+                yield error_resource_response.to_primitive()
+
+    def _collect_manager_resources(self, manager, params, result_queue, stop_event):
+        # Resource metadata layouts can be sent only on CloudServiceType
+        include_metadata = not params.get('options', {}).get('cloud_service_type_metadata_only', False)
+        try:
+            for result in manager.collect_resources(params):
+                primitive = result.to_primitive_with_cached_metadata(include_metadata)
+                if not self._put_result(result_queue, primitive, stop_event):
+                    return
+        except Exception as e:
+            _LOGGER.error(f'[collect] failed to yield result => {e}', exc_info=True)
+            error_resource_response = self.generate_error_response(e, '', 'inventory.Error')
+            self._put_result(result_queue, error_resource_response.to_primitive(), stop_event)
+        finally:
+            self._put_result(result_queue, _COLLECT_DONE, stop_event)
+
+    @staticmethod
+    def _put_result(result_queue, result, stop_event):
+        while not stop_event.is_set():
+            try:
+                result_queue.put(result, timeout=RESULT_QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
     def _get_target_execute_manager(self, options):
         if 'cloud_service_types' in options:
             execute_managers = self._match_execute_manager(options['cloud_service_types'])
@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import MagicMock
+
+from spaceone.inventory.connector.big_query import BigQueryConnector
+from spaceone.inventory.manager.big_query_manager import BigQueryManager
+
+PROJECT_ID = 'project-a'
+DATA_SETS = [{'datasetReference': {'projectId': PROJECT_ID, 'datasetId': 'sales'}, 'location': 'US'}]
+
+# jobs.query rows of each INFORMATION_SCHEMA view and __TABLES__
+QUERY_ROWS = {
+    'INFORMATION_SCHEMA.TABLES': [
+        {'table_schema': 'sales', 'table_name': 'orders', 'table_type': 'BASE TABLE',
+         'creation_time': '1.6409952E9',
+         'ddl': 'CREATE TABLE `project-a.sales.orders` (...) '
+                'PARTITION BY RANGE_BUCKET(customer_id, GENERATE_ARRAY(0, 100, 10));'},
+        {'table_schema': 'sales', 'table_name': 'orders_view', 'table_type': 'VIEW',
+         'creation_time': '1.6409952E9', 'ddl': 'CREATE VIEW `project-a.sales.orders_view` AS SELECT 1;'}
+    ],
+    'INFORMATION_SCHEMA.COLUMNS': [
+        {'table_schema': 'sales', 'table_name': 'orders', 'column_name': 'items', 'is_nullable': 'NO',
+         'data_type': 'ARRAY<STRUCT<sku STRING(10), quantity INT64, `unit price` NUMERIC(10, 2), '
+                      'tags ARRAY<STRING>>>', 'ordinal_position': '3'},
+        {'table_schema': 'sales', 'table_name': 'orders', 'column_name': 'customer_id', 'is_nullable': 'NO',
+         'data_type': 'INT64', 'ordinal_position': '1'},
+        {'table_schema': 'sales', 'table_name': 'orders', 'column_name': 'shipping', 'is_nullable': 'YES',
+         'data_type': 'STRUCT<address STRING, express BOOL, weight FLOAT64>', 'ordinal_position': '2'},
+        {'table_schema': 'sales', 'table_name': 'orders_view', 'column_name': 'one', 'is_nullable': 'YES',
+         'data_type': 'INT64', 'ordinal_position': '1'}
+    ],
+    'INFORMATION_SCHEMA.TABLE_STORAGE': [
+        {'table_schema': 'sales', 'table_name': 'orders', 'total_rows': '42'}
+    ],
+    'INFORMATION_SCHEMA.TABLE_OPTIONS': [
+        {'table_schema': 'sales', 'table_name': 'orders', 'option_name': 'friendly_name',
+         'option_value': '"Customer orders"'},
+        {'table_schema': 'sales', 'table_name': 'orders', 'option_name': 'expiration_timestamp',
+         'option_value': 'TIMESTAMP "2022-07-01T00:00:00.000Z"'},
+        {'table_schema': 'sales', 'table_name': 'orders', 'option_name': 'labels',
+         'option_value': '[STRUCT("team", "sales"), STRUCT("env", "prod")]'}
+    ],
+    'INFORMATION_SCHEMA.VIEWS': [
+        {'table_schema': 'sales', 'table_name': 'orders_view', 'view_definition': 'SELECT 1',
+         'use_standard_sql': 'YES'}
+    ],
+    '__TABLES__': [
+        {'dataset_id': 'sales', 'table_id': 'orders', 'last_modified_time': '1641081600000'},
+        {'dataset_id': 'sales', 'table_id': 'orders_view', 'last_modified_time': '1640995200000'}
+    ]
+}
+
+# tables.get responses of the same tables
+TABLES_GET = {
+    'orders': {
+        'kind': 'bigquery#table',
+        'id': 'project-a:sales.orders',
+        'tableReference': {'projectId': PROJECT_ID, 'datasetId': 'sales', 'tableId': 'orders'},
+        'friendlyName': 'Customer orders',
+        'labels': {'team': 'sales', 'env': 'prod'},
+        'schema': {'fields': [
+            {'name': 'customer_id', 'type': 'INTEGER', 'mode': 'REQUIRED'},
+            {'name': 'shipping', 'type': 'RECORD', 'mode': 'NULLABLE', 'fields': [
+                {'name': 'address', 'type': 'STRING', 'mode': 'NULLABLE'},
+                {'name': 'express', 'type': 'BOOLEAN', 'mode': 'NULLABLE'},
+                {'name': 'weight', 'type': 'FLOAT', 'mode': 'NULLABLE'}
+            ]},
+            {'name': 'items', 'type': 'RECORD', 'mode': 'REPEATED', 'fields': [
+                {'name': 'sku', 'type': 'STRING', 'mode': 'NULLABLE', 'maxLength': '10'},
+                {'name': 'quantity', 'type': 'INTEGER', 'mode': 'NULLABLE'},
+                {'name': 'unit price', 'type': 'NUMERIC', 'mode': 'NULLABLE', 'precision': '10', 'scale': '2'},
+                {'name': 'tags', 'type': 'STRING', 'mode': 'REPEATED'}
+            ]}
+        ]},
+        'rangePartitioning': {'field': 'customer_id', 'range': {'start': '0', 'end': '100', 'interval': '10'}},
+        'numRows': '42',
+        'creationTime': '1640995200000',
+        'expirationTime': '1656633600000',
+        'lastModifiedTime': '1641081600000',
+        'type': 'TABLE',
+        'location': 'US'
+    },
+    'orders_view': {
+        'kind': 'bigquery#table',
+        'id': 'project-a:sales.orders_view',
+        'tableReference': {'projectId': PROJECT_ID, 'datasetId': 'sales', 'tableId': 'orders_view'},
+        'schema': {'fields': [{'name': 'one', 'type': 'INTEGER', 'mode': 'NULLABLE'}]},
+        'view': {'query': 'SELECT 1', 'useLegacySql': False},
+        'creationTime': '1640995200000',
+        'lastModifiedTime': '1640995200000',
+        'type': 'VIEW',
+        'location': 'US'
+    }
+}
+
+# Keys of tables.get shown by the table layout
+TABLE_KEYS = ['kind', 'id', 'tableReference', 'friendlyName', 'labels', 'type', 'rangePartitioning', 'view',
+              'numRows', 'creationTime', 'expirationTime', 'lastModifiedTime']
+# Type parameters are not in INFORMATION_SCHEMA.COLUMNS data_type
+SCHEMA_FIELD_KEYS = ['name', 'type', 'mode', 'fields']
+
+
+def _get_query_response(projectId, body):
+    for source, rows in QUERY_ROWS.items():
+        if source in body['query']:
+            field_names = list(rows[0])
+            return {
+                'jobComplete': True,
+                'jobReference': {'projectId': projectId, 'jobId': 'job-a'},
+                'schema': {'fields': [{'name': field_name} for field_name in field_names]},
+                'rows': [{'f': [{'v': row[field_name]} for field_name in field_names]} for row in rows]
+            }
+    raise ValueError(body['query'])
+
+
+def _get_schema_fields(fields):
+    return [{key: _get_schema_fields(value) if key == 'fields' else value
+             for key, value in field.items() if key in SCHEMA_FIELD_KEYS} for field in fields]
+
+
+class TestBigQueryInformationSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.big_query_conn = BigQueryConnector.__new__(BigQueryConnector)
+        self.big_query_conn.project_id = PROJECT_ID
+        self.big_query_conn.client = MagicMock()
+        self.big_query_conn.client.jobs.return_value.query.side_effect = \
+            lambda **query: MagicMock(execute=MagicMock(return_value=_get_query_response(**query)))
+        self.big_query_manager = BigQueryManager.__new__(BigQueryManager)
+
+    def test_table_details_have_tables_get_shape(self):
+        table_details = self.big_query_manager._get_table_details_from_information_schema(self.big_query_conn,
+                                                                                         PROJECT_ID, DATA_SETS)
+
+        self.assertEqual(set(table_details), {('sales', 'orders'), ('sales', 'orders_view')})
+        for table_id, table_get in TABLES_GET.items():
+            table_detail = table_details[('sales', table_id)]
+            for key in TABLE_KEYS:
+                self.assertEqual(table_detail.get(key), table_get.get(key), f'{table_id}.{key}')
+            self.assertEqual(table_detail['schema']['fields'], _get_schema_fields(table_get['schema']['fields']))
+
+    def test_table_schemas_do_not_depend_on_table_metadata_source(self):
+        table_details = self.big_query_manager._get_table_details_from_information_schema(self.big_query_conn,
+                                                                                         PROJECT_ID, DATA_SETS)
+        bq_dt_tables = [{'tableReference': table_get['tableReference']} for table_get in TABLES_GET.values()]
+        big_conn = MagicMock()
+        big_conn.batch_get_tables.return_value = {table_id: {**table_get, 'schema': {
+            'fields': _get_schema_fields(table_get['schema']['fields'])}} for table_id, table_get in TABLES_GET.items()}
+
+        _, information_schema_schemas = BigQueryManager._get_table_list_with_schema(big_conn, bq_dt_tables,
+                                                                                    table_details)
+        _, tables_get_schemas = BigQueryManager._get_table_list_with_schema(big_conn, bq_dt_tables)
+
+        self.assertEqual(information_schema_schemas, tables_get_schemas)
+
+
+class TestBigQueryTableValidators(unittest.TestCase):
+
+    def test_table_validators_are_queried_once_per_location(self):
+        big_query_conn = MagicMock()
+        big_query_conn.list_tables_last_modified_times.side_effect = lambda dataset_ids, location: {
+            (dataset_id, 'orders'): f'{location}-{dataset_id}' for dataset_id in dataset_ids}
+        data_sets = [{'datasetReference': {'projectId': PROJECT_ID, 'datasetId': dataset_id}, 'location': location}
+                     for dataset_id, location in [('sales', 'US'), ('_hidden', 'US'), ('logs', 'US'),
+                                                  ('archive', 'EU')]]
+
+        validators = BigQueryManager.__new__(BigQueryManager)._get_table_validators(big_query_conn, data_sets)
+
+        self.assertEqual(validators, {'sales': {'orders': 'US-sales'}, 'logs': {'orders': 'US-logs'},
+                                      'archive': {'orders': 'EU-archive'}})
+        self.assertEqual(big_query_conn.list_tables_last_modified_times.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import MagicMock
+
+from spaceone.inventory.connector.monitoring import MonitoringConnector
+from spaceone.inventory.manager.storage_manager import StorageManager
+
+OBJECT_COUNT_RESPONSE = {
+    'timeSeries': [
+        {
+            'resource': {'type': 'gcs_bucket', 'labels': {'bucket_name': 'bucket-a'}},
+            'points': [
+                {'interval': {'endTime': '2022-01-02T00:00:00Z'}, 'value': {'int64Value': '1200'}},
+                {'interval': {'endTime': '2022-01-01T00:00:00Z'}, 'value': {'int64Value': '1100'}}
+            ]
+        },
+        {
+            'resource': {'type': 'gcs_bucket', 'labels': {'bucket_name': 'bucket-b'}},
+            'points': [{'interval': {'endTime': '2022-01-02T00:00:00Z'}, 'value': {'int64Value': '7'}}]
+        },
+        {
+            'resource': {'type': 'gcs_bucket', 'labels': {'bucket_name': 'bucket-empty'}},
+            'points': []
+        }
+    ]
+}
+
+TOTAL_BYTES_RESPONSE = {
+    'timeSeries': [
+        {
+            'resource': {'type': 'gcs_bucket', 'labels': {'bucket_name': 'bucket-a'}},
+            'points': [{'interval': {'endTime': '2022-01-02T00:00:00Z'}, 'value': {'doubleValue': 5242880.0}}]
+        }
+    ]
+}
+
+LISTING_OPTIONS = {'mode': 'sequential', 'max_objects': 100000, 'time_budget': 300, 'max_api_calls': 1000}
+
+
+def _get_monitoring_connector(responses):
+    monitoring_conn = MonitoringConnector.__new__(MonitoringConnector)
+    monitoring_conn.project_id = 'project-a'
+    monitoring_conn.client = MagicMock()
+    time_series = monitoring_conn.client.projects.return_value.timeSeries.return_value
+    time_series.list.return_value.execute.side_effect = responses
+    time_series.list_next.return_value = None
+    return monitoring_conn, time_series
+
+
+class TestMonitoringConnector(unittest.TestCase):
+
+    def test_list_bucket_metric(self):
+        monitoring_conn, time_series = _get_monitoring_connector([OBJECT_COUNT_RESPONSE])
+
+        bucket_metric = monitoring_conn.list_bucket_metric('storage/object_count')
+
+        # Latest point of each bucket, buckets without points are skipped
+        self.assertEqual(bucket_metric, {'bucket-a': 1200, 'bucket-b': 7})
+
+        query = time_series.list.call_args.kwargs
+        self.assertEqual(query['name'], 'projects/project-a')
+        self.assertEqual(query['filter'], 'metric.type="storage.googleapis.com/storage/object_count"')
+        self.assertEqual(query['aggregation_perSeriesAligner'], 'ALIGN_MAX')
+        self.assertEqual(query['aggregation_crossSeriesReducer'], 'REDUCE_SUM')
+        self.assertEqual(query['aggregation_groupByFields'], 'resource.label.bucket_name')
+
+    def test_list_bucket_metric_double_value(self):
+        monitoring_conn, _ = _get_monitoring_connector([TOTAL_BYTES_RESPONSE])
+
+        self.assertEqual(monitoring_conn.list_bucket_metric('storage/total_bytes'), {'bucket-a': 5242880.0})
+
+
+class TestStorageManagerBucketMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.storage_manager = StorageManager.__new__(StorageManager)
+        monitoring_conn, _ = _get_monitoring_connector([OBJECT_COUNT_RESPONSE, TOTAL_BYTES_RESPONSE])
+        self.storage_manager.locator = MagicMock()
+        self.storage_manager.locator.get_connector.return_value = monitoring_conn
+
+    def test_get_bucket_metrics(self):
+        bucket_metrics = self.storage_manager._get_bucket_metrics({'secret_data': {}})
+
+        # bucket-b has no total_bytes metric
+        self.assertEqual(bucket_metrics, {'bucket-a': (1200, 5242880.0)})
+
+    def test_get_object_stats_falls_back_to_listing(self):
+        bucket_metrics = self.storage_manager._get_bucket_metrics({'secret_data': {}})
+        storage_conn = MagicMock()
+        storage_conn.get_object_stats.return_value = (7, 700, True)
+
+        self.assertEqual(self.storage_manager._get_object_stats(storage_conn, 'bucket-a', LISTING_OPTIONS,
+                                                                bucket_metrics),
+                         (1200, 5242880.0, True, 'Monitoring'))
+        storage_conn.get_object_stats.assert_not_called()
+
+        self.assertEqual(self.storage_manager._get_object_stats(storage_conn, 'bucket-b', LISTING_OPTIONS,
+                                                                bucket_metrics),
+                         (7, 700, True, 'Listing'))
+        storage_conn.get_object_stats.assert_called_once_with('bucket-b', 100000)
+
+    def test_get_bucket_metrics_error(self):
+        self.storage_manager.locator.get_connector.side_effect = Exception('monitoring api is disabled')
+
+        self.assertEqual(self.storage_manager._get_bucket_metrics({'secret_data': {}}), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from spaceone.inventory.libs import table_cache
+from spaceone.inventory.libs.table_cache import TableCache
+
+KEY = ('project-a', 'sales', 'orders')
+
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'bigquery_table_cache.db')
+        self.table_cache = TableCache(self.path, max_size=2)
+
+    def tearDown(self):
+        self.table_cache.close()
+
+    def test_get_validated_detail(self):
+        self.table_cache.put(KEY, '1641081600000', {'numRows': '42'})
+
+        self.assertEqual(self.table_cache.get(KEY, '1641081600000'), {'numRows': '42'})
+        self.assertIsNone(self.table_cache.get(KEY, '1641168000000'))
+        self.assertEqual((self.table_cache.hits, self.table_cache.misses), (1, 1))
+
+    @patch.object(table_cache, 'EVICT_INTERVAL', 3)
+    def test_evict_after_puts(self):
+        for table_id in ['t1', 't2', 't3']:
+            self.table_cache.put(('project-a', 'sales', table_id), 'v', {})
+
+        count = sqlite3.connect(self.path).execute('SELECT count(*) FROM table_cache').fetchone()[0]
+        self.assertEqual(count, 2)
+
+    def test_locked_database_is_miss(self):
+        self.table_cache.put(KEY, 'v', {})
+        self.table_cache._conn.execute('PRAGMA busy_timeout = 0')
+        other_conn = sqlite3.connect(self.path)
+        other_conn.execute('BEGIN EXCLUSIVE')
+
+        try:
+            self.assertIsNone(self.table_cache.get(KEY, 'v'))
+            self.table_cache.put(('project-a', 'sales', 'customers'), 'v', {})
+        finally:
+            other_conn.rollback()
+
+        self.assertEqual(self.table_cache.errors, 2)
+        self.assertEqual(self.table_cache.get(KEY, 'v'), {})
+        self.assertIsNone(self.table_cache.get(('project-a', 'sales', 'customers'), 'v'))
+
+
+if __name__ == '__main__':
+    unittest.main()